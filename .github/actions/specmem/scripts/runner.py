@@ -7,22 +7,59 @@ in a format suitable for GitHub Actions.
 
 from __future__ import annotations
 
-import json
 import os
+import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from pathlib import Path
+from typing import Any
 
 
-@dataclass
+# Prefer a C JSON codec when one is installed; stdlib json is the fallback
+try:
+    import orjson
+
+    def json_loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Output variables queued by set_output(), written by flush_outputs()
+_pending_outputs: list[tuple[str, bytes]] = []
+
+# Serializes log output from concurrently running commands
+_print_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result from running a single command."""
 
     command: str
     success: bool
-    output: str
+    output: bytes
     data: dict
+    # Command stdout when it parsed as JSON, so it can be re-emitted verbatim
+    raw_json: bytes | None = None
+
+
+# Stand-in for commands that were not requested
+_MISSING = CommandResult("", False, b"", {})
 
 
 def run_command(cmd: str, working_dir: str) -> CommandResult:
@@ -35,47 +72,103 @@ def run_command(cmd: str, working_dir: str) -> CommandResult:
     Returns:
         CommandResult with parsed output
     """
-    full_cmd = f"specmem {cmd} --robot"
-
     try:
         result = subprocess.run(
-            full_cmd,
-            shell=True,
+            ["specmem", *shlex.split(cmd), "--robot"],
             cwd=working_dir,
             capture_output=True,
-            text=True,
             timeout=300,
             check=False,  # 5 minute timeout
         )
 
-        # Try to parse JSON output
+        # Try to parse JSON output straight from the captured bytes
+        # (isspace() avoids copying stdout via strip())
+        raw_json = None
         try:
-            data = json.loads(result.stdout) if result.stdout.strip() else {}
-        except json.JSONDecodeError:
-            data = {"raw_output": result.stdout}
+            if result.stdout and not result.stdout.isspace():
+                data = json_loads(result.stdout)
+                raw_json = result.stdout
+            else:
+                data = {}
+        except ValueError:
+            data = {"raw_output": result.stdout.decode("utf-8", errors="replace")}
 
         return CommandResult(
             command=cmd,
             success=result.returncode == 0,
             output=result.stdout + result.stderr,
             data=data,
+            raw_json=raw_json,
         )
     except subprocess.TimeoutExpired:
         return CommandResult(
             command=cmd,
             success=False,
-            output="Command timed out after 5 minutes",
+            output=b"Command timed out after 5 minutes",
             data={"error": "timeout"},
         )
     except Exception as e:
         return CommandResult(
             command=cmd,
             success=False,
-            output=str(e),
+            output=str(e).encode(),
             data={"error": str(e)},
         )
 
 
+def run_and_report(cmd: str, working_dir: str) -> CommandResult:
+    """Run a specmem command and log when it starts and how it finished.
+
+    Safe to call from worker threads: each block of log lines is written
+    under a lock, so lines from concurrent commands never interleave. The
+    start line is printed before the command runs, so a command that hangs
+    still shows up in the log.
+
+    Args:
+        cmd: The specmem subcommand to run
+        working_dir: Directory to run the command in
+
+    Returns:
+        CommandResult with parsed output
+    """
+    with _print_lock:
+        print(f"--- Running: specmem {cmd} ---", flush=True)
+
+    result = run_command(cmd, working_dir)
+
+    with _print_lock:
+        if result.success:
+            print(f"✅ {cmd} completed successfully")
+        else:
+            print(f"⚠️ {cmd} had issues (continuing with other commands)")
+            # Decode only the head of the output, straight from a zero-copy view
+            head = str(memoryview(result.output)[:500], "utf-8", "replace")
+            print(f"Output: {head}")
+        sys.stdout.flush()
+
+    return result
+
+
+def build_results_json(summary: dict[str, Any], results: dict[str, CommandResult]) -> bytes:
+    """Serialize the summary metrics plus per-command data as one JSON object.
+
+    Command output that already parsed as JSON is spliced in verbatim under
+    "commands" rather than being re-encoded from its parsed form.
+
+    Args:
+        summary: Non-empty dict of top-level metrics
+        results: Command results keyed by command name
+
+    Returns:
+        UTF-8 JSON equivalent to ``json_dumps({**summary, "commands": ...})``
+    """
+    commands = []
+    for name, result in results.items():
+        value = result.raw_json if result.raw_json is not None else json_dumps(result.data)
+        commands.append(json_dumps(name) + b":" + value)
+    return json_dumps(summary)[:-1] + b',"commands":{' + b",".join(commands) + b"}}"
+
+
 def validate_working_directory(path: str) -> bool:
     """Validate that the working directory exists.
 
@@ -85,34 +178,56 @@ def validate_working_directory(path: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not Path(path).exists():
-        print(f"::error::Working directory does not exist: {path}")
-        return False
-    if not Path(path).is_dir():
+    # os.path keeps the common case to one stat call with no Path objects;
+    # the second stat only happens to pick the error message
+    if os.path.isdir(path):  # noqa: PTH112
+        return True
+    if os.path.exists(path):  # noqa: PTH110
         print(f"::error::Working directory is not a directory: {path}")
-        return False
-    return True
+    else:
+        print(f"::error::Working directory does not exist: {path}")
+    return False
+
 
+def set_output(name: str, value: str | bytes) -> None:
+    """Queue a GitHub Actions output variable.
 
-def set_output(name: str, value: str) -> None:
-    """Set a GitHub Actions output variable.
+    Outputs are buffered and written together by flush_outputs().
 
     Args:
         name: Output variable name
-        value: Output value
+        value: Output value, as text or UTF-8 bytes
     """
+    _pending_outputs.append((name, value.encode() if isinstance(value, str) else value))
+
+
+def flush_outputs() -> None:
+    """Write all queued output variables with a single append to GITHUB_OUTPUT."""
     github_output = os.environ.get("GITHUB_OUTPUT")
     if github_output:
-        with open(github_output, "a") as f:
+        chunks = []
+        for name, value in _pending_outputs:
             # Handle multiline values
-            if "\n" in str(value):
-                delimiter = "EOF"
-                f.write(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
+            if b"\n" in value:
+                delimiter = b"EOF"
+                chunks.append(b"%s<<%s\n%s\n%s\n" % (name.encode(), delimiter, value, delimiter))
             else:
-                f.write(f"{name}={value}\n")
+                chunks.append(b"%s=%s\n" % (name.encode(), value))
+
+        # Values are already bytes, so write them straight to the file
+        # descriptor rather than through a text-mode wrapper
+        buf = memoryview(b"".join(chunks))
+        fd = os.open(github_output, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            while buf:
+                buf = buf[os.write(fd, buf) :]
+        finally:
+            os.close(fd)
     else:
         # Fallback for local testing
-        print(f"::set-output name={name}::{value}")
+        for name, value in _pending_outputs:
+            print(f"::set-output name={name}::{value.decode('utf-8', errors='replace')}")
+    _pending_outputs.clear()
 
 
 def main() -> int:
@@ -137,27 +252,27 @@ def main() -> int:
         return 1
 
     print(f"::group::Running SpecMem commands: {', '.join(commands)}")
-    print(f"Working directory: {working_dir}")
-
-    # Run each command
-    results: dict[str, CommandResult] = {}
-    for cmd in commands:
-        print(f"\n--- Running: specmem {cmd} ---")
-        result = run_command(cmd, working_dir)
-        results[cmd] = result
-
-        if result.success:
-            print(f"✅ {cmd} completed successfully")
-        else:
-            print(f"⚠️ {cmd} had issues (continuing with other commands)")
-            print(f"Output: {result.output[:500]}")
+    print(f"Working directory: {working_dir}", flush=True)
+
+    # Commands are independent, so run them concurrently. Each worker
+    # spends its time waiting on a subprocess, which releases the GIL.
+    # Keys are inserted up front so results keep the requested command
+    # order no matter which command finishes first.
+    results: dict[str, CommandResult] = dict.fromkeys(commands, _MISSING)
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        futures = {executor.submit(run_and_report, cmd, working_dir): cmd for cmd in commands}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
     print("::endgroup::")
 
     # Extract key metrics
-    cov_data = results.get("cov", CommandResult("cov", False, "", {})).data
-    health_data = results.get("health", CommandResult("health", False, "", {})).data
-    validate_data = results.get("validate", CommandResult("validate", False, "", {})).data
+    def data_for(name: str) -> dict:
+        return (results.get(name) or _MISSING).data
+
+    cov_data = data_for("cov")
+    health_data = data_for("health")
+    validate_data = data_for("validate")
 
     coverage_percentage = cov_data.get("coverage_percentage", 0)
     health_grade = health_data.get("letter_grade", "N/A")
@@ -165,12 +280,11 @@ def main() -> int:
     validation_errors = len(validate_data.get("errors", []))
 
     # Build full results
-    full_results = {
+    summary = {
         "coverage_percentage": coverage_percentage,
         "health_grade": health_grade,
         "health_score": health_score,
         "validation_errors": validation_errors,
-        "commands": {k: v.data for k, v in results.items()},
     }
 
     # Set outputs
@@ -178,7 +292,8 @@ def main() -> int:
     set_output("health_grade", str(health_grade))
     set_output("health_score", str(health_score))
     set_output("validation_errors", str(validation_errors))
-    set_output("results_json", json.dumps(full_results))
+    set_output("results_json", build_results_json(summary, results))
+    flush_outputs()
 
     # Print summary
     print("\n📊 SpecMem Analysis Results:")
@@ -7,15 +7,65 @@ user-configured thresholds and fails the action if needed.
 
 from __future__ import annotations
 
-import json
 import os
 import sys
+from typing import Any
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with the fastest installed codec.
+
+    The codec is imported on first use so runs without thresholds never
+    load one. orjson and ujson are preferred; stdlib json is the fallback.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed value
+    """
+    try:
+        import orjson
+    except ImportError:
+        try:
+            import ujson as json
+        except ImportError:
+            import json
+        return json.loads(data)
+    return orjson.loads(data)
 
 
 # Grade ordering for comparison (higher is better)
 GRADE_ORDER = {"A": 5, "B": 4, "C": 3, "D": 2, "F": 1, "N/A": 0}
 
 
+def _build_grade_lut() -> bytes:
+    """Build a byte table mapping an uppercase grade letter's code to its order."""
+    lut = bytearray(256)
+    for grade, order in GRADE_ORDER.items():
+        if len(grade) == 1:
+            lut[ord(grade)] = order
+    return bytes(lut)
+
+
+# Indexed by the first character's code with lowercase folded to uppercase
+_GRADE_LUT = _build_grade_lut()
+
+
+def grade_order(grade: str) -> int:
+    """Return the ordering of a letter grade, or 0 for unknown grades like N/A.
+
+    Args:
+        grade: Letter grade in either case
+
+    Returns:
+        Grade order from GRADE_ORDER
+    """
+    if len(grade) != 1 or not grade.isascii():
+        return 0
+    return _GRADE_LUT[ord(grade) & 0x5F]
+
+
 def check_coverage_threshold(coverage: float, threshold: float) -> str | None:
     """Check if coverage meets threshold.
 
@@ -41,13 +91,7 @@ def check_health_threshold(grade: str, threshold: str) -> str | None:
     Returns:
         Error message if failed, None if passed
     """
-    if not threshold:
-        return None
-
-    current_order = GRADE_ORDER.get(grade.upper(), 0)
-    threshold_order = GRADE_ORDER.get(threshold.upper(), 0)
-
-    if current_order < threshold_order:
+    if threshold and grade_order(grade) < grade_order(threshold):
         return f"Health grade {grade} is below threshold {threshold}"
     return None
 
@@ -79,10 +123,21 @@ def main() -> int:
     health_threshold = os.environ.get("HEALTH_THRESHOLD", "")
     fail_on_validation = os.environ.get("FAIL_ON_VALIDATION", "false").lower() == "true"
 
+    # Parse threshold
+    try:
+        cov_threshold = float(coverage_threshold)
+    except ValueError:
+        cov_threshold = 0
+
+    # Nothing to check, so skip parsing the results entirely
+    if cov_threshold <= 0 and not health_threshold and not fail_on_validation:
+        print("✅ All threshold checks passed")
+        return 0
+
     # Parse results
     try:
-        results = json.loads(results_json)
-    except json.JSONDecodeError:
+        results = json_loads(results_json)
+    except ValueError:
         print("::warning::Failed to parse results JSON, skipping threshold checks")
         return 0
 
@@ -91,33 +146,18 @@ def main() -> int:
     health_grade = str(results.get("health_grade", "N/A"))
     validation_errors = int(results.get("validation_errors", 0))
 
-    # Parse threshold
-    try:
-        cov_threshold = float(coverage_threshold)
-    except ValueError:
-        cov_threshold = 0
-
-    # Run checks
-    failures: list[str] = []
-
-    cov_check = check_coverage_threshold(coverage, cov_threshold)
-    if cov_check:
-        failures.append(cov_check)
-
-    health_check = check_health_threshold(health_grade, health_threshold)
-    if health_check:
-        failures.append(health_check)
-
-    val_check = check_validation_errors(validation_errors, fail_on_validation)
-    if val_check:
-        failures.append(val_check)
+    # Run all checks in one pass
+    checks = (
+        check_coverage_threshold(coverage, cov_threshold),
+        check_health_threshold(health_grade, health_threshold),
+        check_validation_errors(validation_errors, fail_on_validation),
+    )
+    failures = [failure for failure in checks if failure is not None]
 
     # Report results
     if failures:
-        print("::group::❌ Threshold Check Failed")
-        for failure in failures:
-            print(f"::error::{failure}")
-        print("::endgroup::")
+        errors = "".join(f"::error::{failure}\n" for failure in failures)
+        sys.stdout.write(f"::group::❌ Threshold Check Failed\n{errors}::endgroup::\n")
         return 1
 
     print("✅ All threshold checks passed")
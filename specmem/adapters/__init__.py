@@ -1,14 +1,52 @@
-"""Spec framework adapters for SpecMem."""
-
-from specmem.adapters.base import ExperimentalAdapterWarning, SpecAdapter
-from specmem.adapters.power import PowerAdapter, PowerInfo, ToolInfo
-from specmem.adapters.registry import (
-    detect_adapters,
-    get_adapter,
-    get_all_adapters,
-    get_experimental_adapters,
-    get_registry,
-)
+"""Spec framework adapters for SpecMem.
+
+Public names are resolved lazily (PEP 562) so importing one helper, such as
+``detect_adapters``, does not import every adapter submodule up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from specmem.adapters.base import ExperimentalAdapterWarning, SpecAdapter
+    from specmem.adapters.power import PowerAdapter, PowerInfo, ToolInfo
+    from specmem.adapters.registry import (
+        detect_adapters,
+        get_adapter,
+        get_all_adapters,
+        get_experimental_adapters,
+        get_registry,
+    )
+
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "ExperimentalAdapterWarning": "base",
+    "SpecAdapter": "base",
+    "PowerAdapter": "power",
+    "PowerInfo": "power",
+    "ToolInfo": "power",
+    "detect_adapters": "registry",
+    "get_adapter": "registry",
+    "get_all_adapters": "registry",
+    "get_experimental_adapters": "registry",
+    "get_registry": "registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
 
 
 __all__ = [
@@ -151,6 +151,7 @@ Manages user sessions and tokens.
         """
         try:
             from specmem.adapters.kiro import KiroAdapter
+            from specmem.core.config import VectorDBConfig
             from specmem.core.memory_bank import MemoryBank
             from specmem.vectordb.embeddings import get_embedding_provider
             from specmem.vectordb.lancedb_store import LanceDBStore
@@ -167,7 +168,7 @@ Manages user sessions and tokens.
             db_path.mkdir(parents=True, exist_ok=True)
 
             embedding_provider = get_embedding_provider()
-            vector_store = LanceDBStore(db_path=str(db_path))
+            vector_store = LanceDBStore(db_path=str(db_path), metric=VectorDBConfig().metric)
 
             # Build memory
             memory_bank = MemoryBank(vector_store, embedding_provider)
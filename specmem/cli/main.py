@@ -96,6 +96,8 @@ def _dedupe_blocks(blocks: list) -> list:
 
 def _vector_store_kwargs(config: SpecMemConfig) -> dict:
     kwargs = {}
+    if config.vectordb.backend == "lancedb":
+        kwargs["metric"] = config.vectordb.metric
     if config.vectordb.backend == "qdrant":
         if config.vectordb.qdrant_url:
             kwargs["url"] = config.vectordb.qdrant_url
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
+import heapq
 import logging
 import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +25,7 @@ from specmem.client.models import (
     SteeringSummary,
 )
 from specmem.client.proposals import ProposalStore
+from specmem.client.query_cache import QueryCache
 from specmem.context import TokenEstimator
 from specmem.core.config import SpecMemConfig
 from specmem.core.memory_bank import MemoryBank
@@ -45,11 +54,52 @@ except ImportError:
 
 
 if TYPE_CHECKING:
-    from specmem.validator import ValidationIssue, ValidationResult
+    from specmem.validator import ValidationEngine, ValidationIssue, ValidationResult
+    from specmem.vectordb.base import QueryResult
 
 
 logger = logging.getLogger(__name__)
 
+# Changed file paths in a git diff, from either "diff --git a/path b/path"
+# or "+++ b/path" lines, matched in a single scan
+_DIFF_FILE_RE = re.compile(r"diff --git a/(?P<a>.+?) b/|\+\+\+ b/(?P<b>.+)")
+
+
+@lru_cache(maxsize=1)
+def _get_shared_token_estimator() -> TokenEstimator:
+    """Get the TokenEstimator shared by all clients, so the encoding loads once."""
+    return TokenEstimator()
+
+
+@lru_cache(maxsize=2048)
+def _extract_title_cached(text: str) -> str:
+    """Extract title from spec text.
+
+    Walks the text line by line with ``str.find`` so only the lines up to
+    the title are sliced out.
+    """
+    start = 0
+    end_of_text = len(text)
+    while start <= end_of_text:
+        end = text.find("\n", start)
+        if end == -1:
+            end = end_of_text
+        line = text[start:end].strip()
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+        if line and not line.startswith("-"):
+            return line[:50] + ("..." if len(line) > 50 else "")
+        start = end + 1
+    return "Untitled"
+
+
+@lru_cache(maxsize=2048)
+def _truncate_text_cached(text: str, max_length: int) -> str:
+    """Truncate text to max length."""
+    if len(text) <= max_length:
+        return text
+    return text[:max_length].rsplit(" ", 1)[0] + "..."
+
 
 class SpecMemClient:
     """Python client for SpecMem agent integration.
@@ -90,11 +140,25 @@ class SpecMemClient:
         self._config: SpecMemConfig | None = None
         self._memory_bank: MemoryBank | None = None
         self._proposal_store: ProposalStore | None = None
-        self._token_estimator = TokenEstimator()
+        self._token_estimator = _get_shared_token_estimator()
+        # Block ID -> token cost of its context bundle summary; cleared on load
+        self._summary_tokens: dict[str, int] = {}
         self._blocks: list[SpecBlock] = []
+        self._blocks_by_id: dict[str, SpecBlock] = {}
+        self._blocks_by_status: dict[SpecStatus, list[SpecBlock]] = {}
+        self._blocks_by_type: dict[SpecType, list[SpecBlock]] = {}
+        # Block ID -> positions in self._blocks, so lookups keep load order
+        self._block_positions: dict[str, list[int]] = {}
+        self._blocks_loaded = False
+        self._blocks_lock = threading.RLock()
         self._memory_indexed = False
         self._graph: SpecImpactGraph | None = None
         self._specdiff: SpecDiff | None = None
+        self._query_cache = QueryCache()
+        # Bumped whenever loaded specs change; keys cached validation results
+        self._blocks_version = 0
+        self._validation_cache: dict[str | None, tuple[int, ValidationResult]] = {}
+        self._validation_engine: ValidationEngine | None = None
 
         # Load configuration
         self._load_config(config_path)
@@ -106,6 +170,9 @@ class SpecMemClient:
 
     def _load_config(self, config_path: str | Path | None) -> None:
         """Load configuration from file."""
+        # Validation settings come from the config, so rebuild the engine
+        self._validation_engine = None
+        self._validation_cache.clear()
         try:
             if config_path:
                 self._config = SpecMemConfig.load(Path(config_path))
@@ -134,7 +201,7 @@ class SpecMemClient:
 
             # Initialize vector store
             db_path = specmem_dir / "vectordb"
-            vector_store = LanceDBStore(db_path=str(db_path))
+            vector_store = LanceDBStore(db_path=str(db_path), metric=self._config.vectordb.metric)
             vector_store.initialize()
 
             # Initialize embedding provider
@@ -151,29 +218,82 @@ class SpecMemClient:
             # Initialize proposal store
             self._proposal_store = ProposalStore(specmem_dir)
 
-            # Load existing specs
-            self._load_specs()
-
             logger.debug("Memory store initialized")
         except Exception as e:
             raise MemoryStoreError(f"Failed to initialize memory store: {e}") from e
 
+    def preload_specs(self) -> None:
+        """Load specs from adapters now instead of on first use.
+
+        Specs are otherwise loaded lazily by the first call that needs them.
+        """
+        self._ensure_blocks_loaded()
+
+    def _ensure_blocks_loaded(self) -> None:
+        """Run the adapter scan once, on first access to the loaded specs."""
+        if self._blocks_loaded:
+            return
+        with self._blocks_lock:
+            if not self._blocks_loaded:
+                self._load_specs()
+                self._blocks_loaded = True
+
     def _load_specs(self) -> None:
-        """Load specs from adapters."""
-        detected = detect_adapters(str(self.path))
+        """Load specs from adapters.
 
-        for adapter in detected:
-            try:
-                blocks = adapter.load(str(self.path))
-                self._blocks.extend(blocks)
-                logger.debug(f"Loaded {len(blocks)} blocks from {adapter.name}")
-            except Exception as e:
-                logger.warning(f"Failed to load from {adapter.name}: {e}")
+        Raises:
+            MemoryStoreError: If adapter detection or indexing fails
+        """
+        self._query_cache.clear()
+        self._summary_tokens.clear()
+        self._blocks_version += 1
+        # Start empty so a retry after a failed load can't duplicate blocks
+        self._blocks = []
+
+        try:
+            detected = detect_adapters(str(self.path))
+            repo_path = str(self.path)
+
+            # Adapters mostly walk and parse files, so load them concurrently
+            if len(detected) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(detected))) as executor:
+                    futures = [executor.submit(adapter.load, repo_path) for adapter in detected]
+            else:
+                futures = None
+
+            # Merge in adapter order so block order stays deterministic
+            for i, adapter in enumerate(detected):
+                try:
+                    blocks = futures[i].result() if futures else adapter.load(repo_path)
+                    self._blocks.extend(blocks)
+                    logger.debug(f"Loaded {len(blocks)} blocks from {adapter.name}")
+                except Exception as e:
+                    logger.warning(f"Failed to load from {adapter.name}: {e}")
+
+            self._index_blocks()
+        except Exception as e:
+            raise MemoryStoreError(f"Failed to load specs: {e}") from e
+
+    def _index_blocks(self) -> None:
+        """Rebuild the ID, position, status, and type lookups over the loaded blocks."""
+        by_status: defaultdict[SpecStatus, list[SpecBlock]] = defaultdict(list)
+        by_type: defaultdict[SpecType, list[SpecBlock]] = defaultdict(list)
+        positions: defaultdict[str, list[int]] = defaultdict(list)
+        for i, block in enumerate(self._blocks):
+            by_status[block.status].append(block)
+            by_type[block.type].append(block)
+            positions[block.id].append(i)
+
+        self._blocks_by_id = {block.id: block for block in self._blocks}
+        self._block_positions = dict(positions)
+        self._blocks_by_status = dict(by_status)
+        self._blocks_by_type = dict(by_type)
 
     def _ensure_memory_indexed(self) -> None:
         """Index loaded specs into the vector store on first retrieval use."""
         if self._memory_indexed:
             return
+        self._ensure_blocks_loaded()
         if self._blocks and self._memory_bank:
             self._memory_bank.add_blocks(self._blocks)
         self._memory_indexed = True
@@ -211,8 +331,8 @@ class SpecMemClient:
             summary = SpecSummary(
                 id=block.id,
                 type=block.type.value,
-                title=self._extract_title(block.text),
-                summary=self._truncate_text(block.text, 200),
+                title=_extract_title_cached(block.text),
+                summary=_truncate_text_cached(block.text, 200),
                 source=block.source,
                 relevance=score,
                 pinned=block.pinned,
@@ -232,24 +352,33 @@ class SpecMemClient:
         triggered_hooks = self._get_hooks_for_files(changed_files)
 
         # Generate TL;DR
-        tldr = self._generate_tldr(specs + designs, self.DEFAULT_TLDR_BUDGET)
+        tldr = self._generate_tldr(
+            [(s.type, s.title, s.pinned) for s in chain(specs, designs)],
+            self.DEFAULT_TLDR_BUDGET,
+        )
 
-        # Calculate tokens
-        total_tokens = self._estimate_bundle_tokens(specs, designs, tldr)
+        # Calculate tokens, reusing each block's summary count across calls
+        token_cache = self._summary_tokens
+        total_tokens = self._estimate_bundle_tokens(specs, designs, tldr, token_cache)
 
         # Add steering tokens
         for s in steering:
             total_tokens += self._token_estimator.count_tokens(s.content)
 
-        # Truncate if over budget
-        while total_tokens > token_budget and (specs or designs):
-            if designs and (not specs or designs[-1].relevance < specs[-1].relevance):
-                designs.pop()
-            elif specs:
-                specs.pop()
-            total_tokens = self._estimate_bundle_tokens(specs, designs, tldr)
-            for s in steering:
-                total_tokens += self._token_estimator.count_tokens(s.content)
+        # Truncate if over budget, dropping the least relevant summaries in bulk
+        if total_tokens > token_budget and (specs or designs):
+            # Lowest relevance first; on ties specs go before designs
+            drop_order = sorted(
+                chain(((s, 0) for s in reversed(specs)), ((d, 1) for d in reversed(designs))),
+                key=lambda item: (item[0].relevance, item[1]),
+            )
+            freed = list(accumulate(token_cache[summary.id] for summary, _ in drop_order))
+            # Fewest drops that bring the total within budget (or all of them)
+            drop_count = min(bisect_left(freed, total_tokens - token_budget) + 1, len(freed))
+            total_tokens -= freed[drop_count - 1]
+            dropped = {id(summary) for summary, _ in drop_order[:drop_count]}
+            specs = [s for s in specs if id(s) not in dropped]
+            designs = [d for d in designs if id(d) not in dropped]
 
         # Build message if no specs found
         message = ""
@@ -294,19 +423,18 @@ class SpecMemClient:
         if not files:
             return []
 
+        self._ensure_blocks_loaded()
+
         # Use SpecImpact graph for traversal
         try:
             impact_set = self.get_impact_set(files)
 
-            # Map graph nodes back to SpecBlocks
-            impacted = []
-            spec_ids = {node.id.replace("spec:", "") for node in impact_set.specs}
-
-            for block in self._blocks:
-                if block.id in spec_ids:
-                    impacted.append(block)
-
-            return impacted
+            # Map graph nodes ("spec:<block id>") back to SpecBlocks by looking
+            # up only the hits, then restore load order
+            spec_ids = {node.id[5:] for node in impact_set.specs if node.id.startswith("spec:")}
+            positions = self._block_positions
+            hits = sorted(chain.from_iterable(positions.get(s, ()) for s in spec_ids))
+            return [self._blocks[i] for i in hits]
         except Exception as e:
             logger.warning(f"SpecImpact graph analysis failed: {e}")
 
@@ -330,22 +458,68 @@ class SpecMemClient:
         Returns:
             List of matching SpecBlock objects
         """
+        self._ensure_blocks_loaded()
         if not self._memory_bank or not self._blocks:
             return []
         self._ensure_memory_indexed()
 
-        results = self._memory_bank.query(
-            query_text=text,
-            top_k=top_k,
-            include_legacy=include_legacy,
-            include_pinned=True,
-        )
+        results = self._cached_query(text, top_k, include_legacy)
+        return self._rank_results(results, top_k)
 
-        # Sort: pinned first, then by score
-        blocks = [(r.block, r.score) for r in results]
-        blocks.sort(key=lambda x: (not x[0].pinned, -x[1]))
+    def batch_query(
+        self,
+        texts: list[str],
+        top_k: int = 10,
+        include_legacy: bool = False,
+    ) -> list[list[SpecBlock]]:
+        """Query specs for several natural language queries at once.
+
+        Queries not already cached are embedded together in one call.
+
+        Args:
+            texts: Natural language queries
+            top_k: Maximum number of results per query
+            include_legacy: Whether to include legacy specs
+
+        Returns:
+            List of matching SpecBlock objects for each query, in the same order
+        """
+        self._ensure_blocks_loaded()
+        if not self._memory_bank or not self._blocks:
+            return [[] for _ in texts]
+        self._ensure_memory_indexed()
+
+        results_by_text: dict[str, list[QueryResult]] = {}
+        missing: list[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self._query_cache.get((text, top_k, include_legacy, True))
+            if cached is None:
+                missing.append(text)
+            else:
+                results_by_text[text] = cached
+
+        if missing:
+            batch = self._memory_bank.batch_query(
+                missing,
+                top_k=top_k,
+                include_legacy=include_legacy,
+                include_pinned=True,
+            )
+            for text, results in zip(missing, batch, strict=True):
+                self._query_cache.set((text, top_k, include_legacy, True), results)
+                results_by_text[text] = results
+
+        return [self._rank_results(results_by_text[text], top_k) for text in texts]
+
+    def _rank_results(self, results: list[QueryResult], top_k: int) -> list[SpecBlock]:
+        """Select top_k blocks: pinned first, then by score."""
+        top = heapq.nsmallest(
+            top_k,
+            ((r.block, r.score) for r in results),
+            key=lambda x: (not x[0].pinned, -x[1]),
+        )
 
-        return [block for block, _ in blocks[:top_k]]
+        return [block for block, _ in top]
 
     def propose_edit(
         self,
@@ -413,39 +587,22 @@ class SpecMemClient:
         Returns:
             Concise summary string
         """
+        self._ensure_blocks_loaded()
         if not self._blocks:
             return "No specifications found in memory."
 
         # Get pinned and high-relevance specs
-        pinned = [b for b in self._blocks if b.pinned and b.status == SpecStatus.ACTIVE]
-        active = [b for b in self._blocks if not b.pinned and b.status == SpecStatus.ACTIVE]
-
-        summaries = []
-        for block in pinned[:5]:
-            summaries.append(
-                SpecSummary(
-                    id=block.id,
-                    type=block.type.value,
-                    title=self._extract_title(block.text),
-                    summary=self._truncate_text(block.text, 100),
-                    source=block.source,
-                    pinned=True,
-                )
-            )
+        active_blocks = self._blocks_by_status.get(SpecStatus.ACTIVE, [])
+        pinned = [b for b in active_blocks if b.pinned]
+        active = [b for b in active_blocks if not b.pinned]
 
-        for block in active[:10]:
-            summaries.append(
-                SpecSummary(
-                    id=block.id,
-                    type=block.type.value,
-                    title=self._extract_title(block.text),
-                    summary=self._truncate_text(block.text, 100),
-                    source=block.source,
-                    pinned=False,
-                )
-            )
+        # The TL;DR only shows type, title, and pin, so skip building summaries
+        entries = [
+            (block.type.value, _extract_title_cached(block.text), block.pinned)
+            for block in chain(pinned[:5], active[:10])
+        ]
 
-        return self._generate_tldr(summaries, token_budget)
+        return self._generate_tldr(entries, token_budget)
 
     def list_specs(
         self,
@@ -461,23 +618,31 @@ class SpecMemClient:
         Returns:
             List of SpecBlock objects
         """
-        blocks = self._blocks
+        self._ensure_blocks_loaded()
 
+        # Unknown filter values are ignored
+        status_enum = None
         if status:
-            try:
+            with contextlib.suppress(ValueError):
                 status_enum = SpecStatus(status.lower())
-                blocks = [b for b in blocks if b.status == status_enum]
-            except ValueError:
-                pass
 
+        type_enum = None
         if type:
-            try:
+            with contextlib.suppress(ValueError):
                 type_enum = SpecType(type.lower())
-                blocks = [b for b in blocks if b.type == type_enum]
-            except ValueError:
-                pass
 
-        return blocks
+        if status_enum is not None and type_enum is not None:
+            # Walk the smaller bucket and check the other attribute
+            by_status = self._blocks_by_status.get(status_enum, [])
+            by_type = self._blocks_by_type.get(type_enum, [])
+            if len(by_status) <= len(by_type):
+                return [b for b in by_status if b.type == type_enum]
+            return [b for b in by_type if b.status == status_enum]
+        if status_enum is not None:
+            return list(self._blocks_by_status.get(status_enum, []))
+        if type_enum is not None:
+            return list(self._blocks_by_type.get(type_enum, []))
+        return self._blocks
 
     # Helper methods
 
@@ -486,6 +651,7 @@ class SpecMemClient:
         files: list[str],
     ) -> list[tuple[SpecBlock, float]]:
         """Find blocks relevant to given files."""
+        self._ensure_blocks_loaded()
         if not self._memory_bank or not self._blocks:
             return []
         self._ensure_memory_indexed()
@@ -493,15 +659,42 @@ class SpecMemClient:
         # Create query from file paths
         query = " ".join(files)
 
-        results = self._memory_bank.query(
-            query_text=query,
-            top_k=20,
-            include_legacy=False,
-            include_pinned=True,
-        )
+        results = self._cached_query(query, 20, include_legacy=False)
 
         return [(r.block, r.score) for r in results]
 
+    def _cached_query(
+        self,
+        text: str,
+        top_k: int,
+        include_legacy: bool,
+        include_pinned: bool = True,
+    ) -> list[QueryResult]:
+        """Query the memory bank, reusing recent results for the same query."""
+        if not self._memory_bank:
+            return []
+
+        key = (text, top_k, include_legacy, include_pinned)
+        results = self._query_cache.get(key)
+        if results is None:
+            results = self._memory_bank.query(
+                query_text=text,
+                top_k=top_k,
+                include_legacy=include_legacy,
+                include_pinned=include_pinned,
+            )
+            self._query_cache.set(key, results)
+        # Hand out a copy so callers can't mutate the cached list
+        return list(results)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get query cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, and hit_rate
+        """
+        return self._query_cache.stats()
+
     def _get_steering_for_files(
         self,
         files: list[str],
@@ -533,7 +726,7 @@ class SpecMemClient:
                         steering_summaries.append(
                             SteeringSummary(
                                 title=steering.title,
-                                content=self._truncate_text(steering.body, 500),
+                                content=_truncate_text_cached(steering.body, 500),
                                 inclusion=steering.inclusion,
                                 pattern=steering.file_match_pattern,
                                 source=path_str,
@@ -587,44 +780,28 @@ class SpecMemClient:
             logger.warning(f"Failed to get hooks for files: {e}")
             return []
 
-    def _extract_title(self, text: str) -> str:
-        """Extract title from spec text."""
-        lines = text.strip().split("\n")
-        for line in lines:
-            line = line.strip()
-            if line.startswith("#"):
-                return line.lstrip("#").strip()
-            if line and not line.startswith("-"):
-                return line[:50] + ("..." if len(line) > 50 else "")
-        return "Untitled"
-
-    def _truncate_text(self, text: str, max_length: int) -> str:
-        """Truncate text to max length."""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length].rsplit(" ", 1)[0] + "..."
-
     def _generate_tldr(
         self,
-        summaries: list[SpecSummary],
+        entries: list[tuple[str, str, bool]],
         token_budget: int,
     ) -> str:
-        """Generate TL;DR from summaries."""
-        if not summaries:
+        """Generate TL;DR from (type, title, pinned) entries."""
+        if not entries:
             return "No specifications available."
 
         lines = ["Key specifications:"]
 
-        for summary in summaries[:5]:
-            pinned = "📌 " if summary.pinned else ""
-            lines.append(f"- {pinned}[{summary.type}] {summary.title}")
+        for spec_type, title, is_pinned in entries[:5]:
+            pinned = "📌 " if is_pinned else ""
+            lines.append(f"- {pinned}[{spec_type}] {title}")
 
-        if len(summaries) > 5:
-            lines.append(f"- ...and {len(summaries) - 5} more")
+        if len(entries) > 5:
+            lines.append(f"- ...and {len(entries) - 5} more")
 
         tldr = "\n".join(lines)
 
-        # Truncate if over budget
+        # Truncate if over budget. At most seven lines, so re-counting the
+        # joined text after each drop is cheaper than per-line bookkeeping.
         tokens = self._token_estimator.count_tokens(tldr)
         while tokens > token_budget and len(lines) > 2:
             lines.pop(-2)  # Remove second-to-last item
@@ -638,35 +815,42 @@ class SpecMemClient:
         specs: list[SpecSummary],
         designs: list[SpecSummary],
         tldr: str,
+        token_cache: dict[str, int] | None = None,
     ) -> int:
-        """Estimate total tokens for a bundle."""
-        total = self._token_estimator.count_tokens(tldr)
-
-        for spec in specs:
-            total += self._token_estimator.count_tokens(spec.summary)
-            total += 20  # Overhead for metadata
+        """Estimate total tokens for a bundle.
 
-        for design in designs:
-            total += self._token_estimator.count_tokens(design.summary)
-            total += 20
+        Args:
+            specs: Spec summaries in the bundle
+            designs: Design summaries in the bundle
+            tldr: TL;DR text
+            token_cache: Optional map of summary ID to its token cost, filled
+                in as summaries are counted so callers can reuse the values
 
-        return total
+        Returns:
+            Estimated token count
+        """
+        if token_cache is None:
+            token_cache = {}
 
-    def _parse_git_diff(self, diff: str) -> list[str]:
-        """Parse git diff to extract changed files."""
-        files = []
+        # Count every uncached summary in a single batch
+        uncached = {s.id: s.summary for s in chain(specs, designs) if s.id not in token_cache}
+        if uncached:
+            counts = self._token_estimator.count_tokens_batch(list(uncached.values()))
+            for summary_id, tokens in zip(uncached, counts, strict=True):
+                # Summary text plus overhead for metadata
+                token_cache[summary_id] = tokens + 20
 
-        # Match diff --git a/path b/path
-        pattern = r"diff --git a/(.+?) b/"
-        matches = re.findall(pattern, diff)
-        files.extend(matches)
+        total = self._token_estimator.count_tokens(tldr)
+        for summary in chain(specs, designs):
+            total += token_cache[summary.id]
 
-        # Match +++ b/path
-        pattern = r"\+\+\+ b/(.+)"
-        matches = re.findall(pattern, diff)
-        files.extend(matches)
+        return total
 
-        return list(set(files))
+    def _parse_git_diff(self, diff: str) -> list[str]:
+        """Parse git diff to extract changed files, in first-seen order."""
+        return list(
+            dict.fromkeys(m.group("a") or m.group("b") for m in _DIFF_FILE_RE.finditer(diff))
+        )
 
     # ==========================================================================
     # SpecImpact Graph Integration
@@ -693,6 +877,7 @@ class SpecMemClient:
 
         # Build new graph
         logger.info("Building new SpecImpact graph...")
+        self._ensure_blocks_loaded()
         builder = GraphBuilder(self.path)
         graph = builder.build(self._blocks, storage_path=graph_path)
         return graph
@@ -728,10 +913,22 @@ class SpecMemClient:
         graph_path = self.path / ".specmem" / "impact_graph.json"
 
         logger.info("Rebuilding SpecImpact graph...")
+        self._ensure_blocks_loaded()
         builder = GraphBuilder(self.path)
         self._graph = builder.build(self._blocks, storage_path=graph_path)
         return self._graph
 
+    def rebuild_index(self) -> bool:
+        """Rebuild the vector store's nearest neighbor index.
+
+        Returns:
+            True if an index was built (small stores are scanned directly)
+        """
+        if not self._memory_bank:
+            return False
+        self._ensure_memory_indexed()
+        return self._memory_bank.vector_store.rebuild_index()
+
     # ==========================================================================
     # SpecDiff Integration - Temporal Spec Intelligence
     # ==========================================================================
@@ -751,14 +948,17 @@ class SpecMemClient:
         """Load existing SpecDiff or create a new one."""
         db_path = self.path / ".specmem" / "specdiff.db"
 
+        # Check before SpecDiff creates the database and its schema
+        is_new = not db_path.exists() or db_path.stat().st_size == 0
+
         # Create SpecDiff with impact graph for drift detection
         specdiff = SpecDiff(db_path, impact_graph=self._graph)
 
         # Build version history if not exists
-        if not db_path.exists() or db_path.stat().st_size == 0:
+        if is_new:
             logger.info("Building initial version history...")
-            for block in self._blocks:
-                specdiff.track_version(block)
+            self._ensure_blocks_loaded()
+            specdiff.track_versions(self._blocks)
 
         return specdiff
 
@@ -811,6 +1011,7 @@ class SpecMemClient:
             List of staleness warnings for stale specs
         """
         if spec_ids is None:
+            self._ensure_blocks_loaded()
             spec_ids = [block.id for block in self._blocks]
 
         return self.specdiff.check_staleness(spec_ids, cached_versions)
@@ -857,6 +1058,8 @@ class SpecMemClient:
         Returns:
             Created SpecVersion
         """
+        self._query_cache.clear()
+        self._blocks_version += 1
         return self.specdiff.track_version(spec)
 
     def acknowledge_staleness(
@@ -899,6 +1102,20 @@ class SpecMemClient:
         Returns:
             ValidationResult with all issues found
         """
+        self._ensure_blocks_loaded()
+        cached = self._validation_cache.get(spec_id)
+        if cached is not None and cached[0] == self._blocks_version:
+            return cached[1]
+
+        result = self._run_validation(spec_id)
+        self._validation_cache[spec_id] = (self._blocks_version, result)
+        return result
+
+    def _get_validation_engine(self) -> ValidationEngine:
+        """Get the validation engine, building it with all rules on first use."""
+        if self._validation_engine is not None:
+            return self._validation_engine
+
         from specmem.validator import (
             AcceptanceCriteriaRule,
             ConstraintRule,
@@ -908,22 +1125,8 @@ class SpecMemClient:
             TimelineRule,
             ValidationConfig,
             ValidationEngine,
-            ValidationResult,
         )
 
-        # Get specs to validate
-        specs = self._blocks
-        if spec_id:
-            specs = [b for b in specs if spec_id in b.id]
-
-        if not specs:
-            return ValidationResult(
-                issues=[],
-                specs_validated=0,
-                rules_run=0,
-                duration_ms=0.0,
-            )
-
         # Load config
         try:
             validation_config = ValidationConfig.from_toml(self._config.to_dict())
@@ -943,8 +1146,28 @@ class SpecMemClient:
             ]
         )
 
+        self._validation_engine = engine
+        return engine
+
+    def _run_validation(self, spec_id: str | None) -> ValidationResult:
+        """Run all validation rules over the selected specs."""
+        from specmem.validator import ValidationResult
+
+        # Get specs to validate
+        specs = self._blocks
+        if spec_id:
+            specs = [b for b in specs if spec_id in b.id]
+
+        if not specs:
+            return ValidationResult(
+                issues=[],
+                specs_validated=0,
+                rules_run=0,
+                duration_ms=0.0,
+            )
+
         # Run validation
-        return engine.validate(specs)
+        return self._get_validation_engine().validate(specs)
 
     def get_validation_errors(
         self,
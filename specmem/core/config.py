@@ -80,6 +80,9 @@ class VectorDBConfig(BaseModel):
     Attributes:
         backend: Vector database backend to use
         path: Path to store vector database files
+        metric: LanceDB distance metric. "dot" stores unit-length vectors and
+            ranks by cosine similarity; every entry point opening the store
+            must use the same value
         agentvectordb_api_key: API key for AgentVectorDB (optional)
         agentvectordb_endpoint: Custom endpoint for AgentVectorDB (optional)
         qdrant_url: Qdrant server or cloud URL (optional; local path used if unset)
@@ -89,6 +92,7 @@ class VectorDBConfig(BaseModel):
 
     backend: Literal["lancedb", "agentvectordb", "chroma", "qdrant"] = "lancedb"
     path: str = ".specmem/vectordb"
+    metric: Literal["l2", "dot"] = "dot"
     agentvectordb_api_key: str | None = None
     agentvectordb_endpoint: str | None = None
     qdrant_url: str | None = None
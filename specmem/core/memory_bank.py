@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from specmem.core.specir import SpecBlock, SpecStatus
-from specmem.vectordb.base import QueryResult, VectorStore
+from specmem.vectordb.base import QueryResult, VectorStore, block_content_hash
 
 
 if TYPE_CHECKING:
@@ -85,6 +85,8 @@ class MemoryBank:
         from specmem.vectordb import get_embedding_provider, get_vector_store
 
         vector_kwargs = {}
+        if config.vectordb.backend == "lancedb":
+            vector_kwargs["metric"] = config.vectordb.metric
         if config.vectordb.backend == "qdrant":
             if config.vectordb.qdrant_url:
                 vector_kwargs["url"] = config.vectordb.qdrant_url
@@ -136,12 +138,25 @@ class MemoryBank:
             else:
                 chunked_blocks.append(block)
 
-        # Generate embeddings
-        texts = [block.text for block in chunked_blocks]
-        embeddings = self.embedding_provider.embed(texts)
+        # Reuse stored embeddings for unchanged blocks and embed only the rest.
+        # Hashes cover the embedding model, so switching models re-embeds.
+        embedding_model = self._embedding_model()
+        content_hashes = [block_content_hash(block, embedding_model) for block in chunked_blocks]
+        stored = self.vector_store.get_stored_embeddings(set(content_hashes))
+        to_embed = {
+            content_hash: block.text
+            for content_hash, block in zip(content_hashes, chunked_blocks, strict=True)
+            if content_hash not in stored
+        }
+        if to_embed:
+            new_embeddings = self.embedding_provider.embed(list(to_embed.values()))
+            stored.update(zip(to_embed, new_embeddings, strict=True))
+        embeddings = [stored[content_hash] for content_hash in content_hashes]
+        logger.debug(f"Embedded {len(to_embed)} texts for {len(chunked_blocks)} blocks")
 
         # Store in vector database
-        self.vector_store.store(chunked_blocks, embeddings)
+        self.vector_store.store(chunked_blocks, embeddings, content_hashes)
+        self.vector_store.ensure_index()
 
         # Track locally
         self._blocks.extend(chunked_blocks)
@@ -149,6 +164,11 @@ class MemoryBank:
         logger.info(f"Added {len(chunked_blocks)} blocks to memory")
         return len(chunked_blocks)
 
+    def _embedding_model(self) -> str:
+        """Identify the embedding space: provider, model and dimension."""
+        provider = self.embedding_provider
+        return f"{type(provider).__name__}:{provider.model_name}:{provider.dimension}"
+
     def _chunk_block(self, block: SpecBlock) -> list[SpecBlock]:
         """Split a large block into smaller chunks.
 
@@ -219,14 +239,58 @@ class MemoryBank:
         # Generate query embedding
         query_embedding = self.embedding_provider.embed([query_text])[0]
 
+        pinned = self.vector_store.get_pinned() if include_pinned else None
+        return self._search(query_embedding, top_k, include_legacy, pinned)
+
+    def batch_query(
+        self,
+        query_texts: list[str],
+        top_k: int = 10,
+        include_legacy: bool = False,
+        include_pinned: bool = True,
+    ) -> list[list[QueryResult]]:
+        """Query memory for several texts at once.
+
+        Embeds all distinct texts in a single provider call and fetches
+        pinned blocks once for the whole batch.
+
+        Args:
+            query_texts: Natural language queries
+            top_k: Maximum number of results per query
+            include_legacy: Whether to include legacy blocks
+            include_pinned: Whether to always include pinned blocks
+
+        Returns:
+            List of QueryResults for each query, in the same order
+        """
+        if not query_texts:
+            return []
+
+        unique_texts = list(dict.fromkeys(query_texts))
+        embeddings = self.embedding_provider.embed(unique_texts)
+        pinned = self.vector_store.get_pinned() if include_pinned else None
+
+        results_by_text = {
+            text: self._search(embedding, top_k, include_legacy, pinned)
+            for text, embedding in zip(unique_texts, embeddings, strict=True)
+        }
+        return [list(results_by_text[text]) for text in query_texts]
+
+    def _search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        include_legacy: bool,
+        pinned: list[SpecBlock] | None,
+    ) -> list[QueryResult]:
+        """Search the vector store and merge in pinned blocks."""
         # Query vector store
         results = self.vector_store.query(
             query_embedding, top_k=top_k, include_legacy=include_legacy
         )
 
         # Add pinned blocks if requested
-        if include_pinned:
-            pinned = self.vector_store.get_pinned()
+        if pinned is not None:
             pinned_ids = {r.block.id for r in results}
 
             for block in pinned:
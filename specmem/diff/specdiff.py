@@ -103,6 +103,29 @@ class SpecDiff:
         Returns:
             Created SpecVersion.
         """
+        return self.track_versions([spec], commit_ref)[0]
+
+    def track_versions(
+        self,
+        specs: list[SpecBlock],
+        commit_ref: str | None = None,
+    ) -> list[SpecVersion]:
+        """Track a new version of several specs at once.
+
+        Resolves the commit once, looks up existing versions in one query,
+        and writes all new versions in a single transaction.
+
+        Args:
+            specs: The spec blocks to track.
+            commit_ref: Optional git commit reference.
+
+        Returns:
+            SpecVersion for each spec, in the same order. Specs that already
+            have this version get the stored version back.
+        """
+        if not specs:
+            return []
+
         # Get commit ref from git if not provided
         if commit_ref is None:
             commit_ref = self._get_current_commit()
@@ -110,28 +133,34 @@ class SpecDiff:
         # Generate version ID
         version_id = commit_ref or datetime.now().strftime("%Y%m%d%H%M%S")
 
-        # Check if this version already exists
-        existing = self._store.get_version(spec.id, version_id)
-        if existing:
-            return existing
-
-        # Create new version
-        version = SpecVersion(
-            spec_id=spec.id,
-            version_id=version_id,
-            timestamp=datetime.now(),
-            content=spec.text,
-            commit_ref=commit_ref,
-            metadata={
-                "source": spec.source,
-                "type": spec.type.value,
-                "tags": spec.tags,
-            },
-        )
-
-        self._store.save_version(version)
-        logger.info(f"Tracked version {version_id} for spec {spec.id}")
-        return version
+        # Check which specs already have this version
+        known = self._store.get_versions([spec.id for spec in specs], version_id)
+
+        versions: list[SpecVersion] = []
+        created: list[SpecVersion] = []
+        for spec in specs:
+            version = known.get(spec.id)
+            if version is None:
+                version = SpecVersion(
+                    spec_id=spec.id,
+                    version_id=version_id,
+                    timestamp=datetime.now(),
+                    content=spec.text,
+                    commit_ref=commit_ref,
+                    metadata={
+                        "source": spec.source,
+                        "type": spec.type.value,
+                        "tags": spec.tags,
+                    },
+                )
+                known[spec.id] = version
+                created.append(version)
+            versions.append(version)
+
+        self._store.save_versions(created)
+        for version in created:
+            logger.info(f"Tracked version {version_id} for spec {version.spec_id}")
+        return versions
 
     def _get_current_commit(self) -> str | None:
         """Get current git commit hash."""
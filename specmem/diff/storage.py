@@ -58,6 +58,9 @@ class VersionStore:
     CREATE INDEX IF NOT EXISTS idx_deprecations_urgency ON deprecations(urgency DESC);
     """
 
+    # Maximum spec IDs bound into a single IN (...) lookup
+    QUERY_BATCH_SIZE = 500
+
     def __init__(self, db_path: Path | str) -> None:
         """Initialize the version store.
 
@@ -119,6 +122,38 @@ class VersionStore:
         conn.commit()
         logger.debug(f"Saved version {version.version_id} for spec {version.spec_id}")
 
+    def save_versions(self, versions: list[SpecVersion]) -> None:
+        """Save several spec versions in a single transaction.
+
+        Args:
+            versions: The versions to save.
+        """
+        if not versions:
+            return
+
+        conn = self._get_connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO spec_versions
+                (spec_id, version_id, timestamp, commit_ref, content_hash, content, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        version.spec_id,
+                        version.version_id,
+                        version.timestamp.isoformat(),
+                        version.commit_ref,
+                        version.content_hash,
+                        version.content,
+                        json.dumps(version.metadata),
+                    )
+                    for version in versions
+                ],
+            )
+        logger.debug(f"Saved {len(versions)} versions")
+
     def get_version(self, spec_id: str, version_id: str) -> SpecVersion | None:
         """Get a specific version.
 
@@ -142,6 +177,36 @@ class VersionStore:
             return self._row_to_version(row)
         return None
 
+    def get_versions(self, spec_ids: list[str], version_id: str) -> dict[str, SpecVersion]:
+        """Get one version for each of several specs.
+
+        Args:
+            spec_ids: Spec identifiers.
+            version_id: Version identifier.
+
+        Returns:
+            Map of spec_id to SpecVersion for the specs that have that version.
+        """
+        conn = self._get_connection()
+        unique_ids = list(dict.fromkeys(spec_ids))
+        found: dict[str, SpecVersion] = {}
+
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(unique_ids), self.QUERY_BATCH_SIZE):
+            batch = unique_ids[start : start + self.QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"""
+                SELECT * FROM spec_versions
+                WHERE version_id = ? AND spec_id IN ({placeholders})
+                """,
+                (version_id, *batch),
+            ).fetchall()
+            for row in rows:
+                found[row["spec_id"]] = self._row_to_version(row)
+
+        return found
+
     def get_history(
         self,
         spec_id: str,
@@ -1,21 +1,22 @@
 """REST API endpoints for SpecMem Web UI."""
 
+import asyncio
+import hashlib
 import logging
 import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 
-from specmem.core.specir import SpecBlock
-from specmem.ui.filters import (
-    calculate_counts,
-    count_by_source,
-    count_by_type,
-    filter_blocks,
-    get_pinned_blocks,
-)
+from specmem.client.query_cache import QueryCache
+from specmem.core.specir import SpecBlock, SpecStatus, SpecType
+from specmem.ui.filters import BlockColumns, compute_stats, get_pinned_blocks
 from specmem.ui.models import (
     BlockDetail,
     BlockListResponse,
@@ -32,16 +33,188 @@ from specmem.ui.models import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["api"])
 
-# These will be set by the server when it starts
-_blocks: list[SpecBlock] = []
-_vector_store = None
-_pack_builder = None
-_workspace_path: Path = Path()
+_DEFAULT_PIN_REASON = "Contains critical specification keyword (SHALL)"
+_PIN_REASON_BY_TYPE: dict[SpecType, str] = {
+    SpecType.REQUIREMENT: "Core requirement specification",
+    SpecType.DESIGN: "Architecture decision",
+}
+
+
+def _context_etag(summary_json: list[bytes], byte_lengths: np.ndarray) -> str:
+    """Compute an ETag covering everything /blocks, /stats and /pinned report.
+
+    The serialized summaries carry ID, type, source, status, pinned flag and
+    preview; the byte lengths cover text changes past the preview.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for summary in summary_json:
+        digest.update(summary)
+    digest.update(byte_lengths.tobytes())
+    return f'"{digest.hexdigest()}"'
+
+
+def _build_pinned_json(
+    blocks: list[SpecBlock], summaries: list[BlockSummary], pinned_index: np.ndarray
+) -> bytes:
+    """Serialize the /pinned response, which only depends on the block list."""
+    pinned = get_pinned_blocks(blocks, pinned_index)
+    responses = [
+        PinnedBlockResponse(
+            block=summaries[i],
+            reason=_PIN_REASON_BY_TYPE.get(block.type, _DEFAULT_PIN_REASON),
+        )
+        for i, block in zip(pinned_index, pinned, strict=True)
+    ]
+    return PinnedListResponse(blocks=responses, total=len(responses)).model_dump_json().encode()
+
+
+def _build_stats_json(blocks: list[SpecBlock], memory_size_bytes: int) -> bytes:
+    """Serialize the /stats response, which only depends on the block list."""
+    stats = compute_stats(blocks, memory_size_bytes=memory_size_bytes)
+    return StatsResponse(**stats).model_dump_json().encode()
+
+
+def _build_list_body(
+    columns: BlockColumns, summary_json: list[bytes], status: str | None, block_type: str | None
+) -> bytes:
+    """Serialize the /blocks response for a filter from the serialized block summaries."""
+    mask = columns.mask(status=status, block_type=block_type)
+    total, active_count, legacy_count, pinned_count = columns.counts(mask)
+
+    # Serialize the counts through the model so the JSON matches BlockListResponse
+    counts_json = BlockListResponse(
+        blocks=[],
+        total=total,
+        active_count=active_count,
+        legacy_count=legacy_count,
+        pinned_count=pinned_count,
+    ).model_dump_json(exclude={"blocks"})
+    blocks_json = b",".join([summary_json[i] for i in np.flatnonzero(mask)])
+    return b'{"blocks":[' + blocks_json + b"]," + counts_json[1:].encode()
+
+
+def _build_list_bodies(
+    columns: BlockColumns, summary_json: list[bytes]
+) -> dict[tuple[str | None, str | None], bytes]:
+    """Serialize the /blocks response for every normalized (status, type) filter.
+
+    Each block appears in four bodies (filtered or not on status and on type),
+    so this costs a few times the size of the serialized summaries.
+    """
+    return {
+        (status, block_type): _build_list_body(columns, summary_json, status, block_type)
+        for status in (None, *(s.value for s in SpecStatus))
+        for block_type in (None, *(t.value for t in SpecType))
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class APIContext:
+    """Blocks and services served by the API, plus indexes derived from the blocks.
+
+    set_context publishes a new instance as a whole, so a request always sees
+    the blocks and their indexes from the same set_context call.
+    """
+
+    blocks: list[SpecBlock] = field(default_factory=list)
+    vector_store: Any = None
+    pack_builder: Any = None
+    workspace_path: Path = field(default_factory=Path)
+
+    # Block ID -> position in blocks, for /blocks/{block_id} and summary reuse
+    id_index: dict[str, int] = field(default_factory=dict)
+    columns: BlockColumns = field(default_factory=lambda: BlockColumns([]))
+    # BlockSummary per block, shared by every response that lists the block
+    summaries: list[BlockSummary] = field(default_factory=list)
+    # JSON-serialized summaries, spliced into /blocks responses
+    summary_json: list[bytes] = field(default_factory=list)
+    # Positions of pinned blocks
+    pinned_index: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    # Serialized /pinned response
+    pinned_json: bytes = field(
+        default_factory=lambda: PinnedListResponse(blocks=[], total=0).model_dump_json().encode()
+    )
+    # Serialized /stats response
+    stats_json: bytes = field(default_factory=lambda: _build_stats_json([], 0))
+    # Validator for the block-derived endpoints; changes with any reported field
+    etag: str = field(default_factory=lambda: _context_etag([], np.empty(0, dtype=np.int64)))
+    # /blocks response bodies for every normalized (status, type) filter
+    list_bodies: dict[tuple[str | None, str | None], bytes] = field(
+        default_factory=lambda: _build_list_bodies(BlockColumns([]), [])
+    )
+
+    # Text search fallback index
+    lower_texts: list[str] = field(default_factory=list)
+    token_index: dict[str, list[int]] = field(default_factory=dict)
+    text_lengths: np.ndarray = field(default_factory=lambda: np.empty(0))
+    # UTF-8 size of each block's text, summed by /stats
+    byte_lengths: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def build(
+        cls,
+        blocks: list[SpecBlock],
+        vector_store: Any = None,
+        pack_builder: Any = None,
+        workspace_path: Path = Path(),
+    ) -> "APIContext":
+        """Build a context and all block-derived indexes.
+
+        Args:
+            blocks: SpecBlocks to serve
+            vector_store: Optional vector store for semantic search
+            pack_builder: Optional pack builder for /export
+            workspace_path: Workspace root
+
+        Returns:
+            New APIContext
+        """
+        lower_texts, token_index = _build_text_index(blocks)
+        summaries = [BlockSummary.from_spec_block(b) for b in blocks]
+        summary_json = [summary.model_dump_json().encode() for summary in summaries]
+        byte_lengths = np.fromiter(
+            (len(b.text.encode("utf-8")) for b in blocks), dtype=np.int64, count=len(blocks)
+        )
+        columns = BlockColumns(blocks)
+        pinned_index = np.flatnonzero(columns.pinned)
+        return cls(
+            blocks=blocks,
+            vector_store=vector_store,
+            pack_builder=pack_builder,
+            workspace_path=workspace_path,
+            # Built in reverse so the first block wins on duplicate IDs
+            id_index={b.id: i for i, b in reversed(list(enumerate(blocks)))},
+            columns=columns,
+            summaries=summaries,
+            summary_json=summary_json,
+            pinned_index=pinned_index,
+            pinned_json=_build_pinned_json(blocks, summaries, pinned_index),
+            stats_json=_build_stats_json(blocks, int(byte_lengths.sum())),
+            lower_texts=lower_texts,
+            token_index=token_index,
+            text_lengths=np.fromiter(
+                (len(b.text) for b in blocks), dtype=np.float64, count=len(blocks)
+            ),
+            byte_lengths=byte_lengths,
+            etag=_context_etag(summary_json, byte_lengths),
+            list_bodies=_build_list_bodies(columns, summary_json),
+        )
+
+
+# Set by the server when it starts; replaced as a whole by set_context
+_ctx = APIContext()
+
+# Serializes pack exports, which all write to the workspace's .specmem directory
+_export_lock = asyncio.Lock()
 
 # Simple in-memory cache with TTL
 _cache: dict[str, tuple[float, Any]] = {}
 _cache_ttl: float = 300.0  # 5 minutes default TTL
 
+# Vector search results keyed by (query, limit); repeated searches from the
+# UI search box skip the embedding call and the ANN query
+_query_cache = QueryCache(max_size=256, ttl_seconds=_cache_ttl)
+
 
 def _get_cached(key: str) -> Any | None:
     """Get cached value if not expired."""
@@ -62,6 +235,7 @@ def clear_cache() -> None:
     """Clear all cached data."""
     global _cache
     _cache = {}
+    _query_cache.clear()
 
 
 def set_context(
@@ -71,63 +245,141 @@ def set_context(
     workspace_path: Path = Path(),
 ):
     """Set the context for API endpoints."""
-    global _blocks, _vector_store, _pack_builder, _workspace_path
-    _blocks = blocks
-    _vector_store = vector_store
-    _pack_builder = pack_builder
-    _workspace_path = workspace_path
+    global _ctx
+    _ctx = APIContext.build(blocks, vector_store, pack_builder, workspace_path)
+    _query_cache.clear()
+
+
+def get_context() -> APIContext:
+    """Get the current API context (FastAPI dependency)."""
+    return _ctx
+
+
+def _build_text_index(blocks: list[SpecBlock]) -> tuple[list[str], dict[str, list[int]]]:
+    """Lowercase each block's text once and map each token to the blocks containing it.
+
+    Returns:
+        Tuple of (lowercased texts, token -> ascending block indices)
+    """
+    lower_texts = [b.text.lower() for b in blocks]
+    token_index: defaultdict[str, list[int]] = defaultdict(list)
+    for i, text in enumerate(lower_texts):
+        for token in set(text.split()):
+            token_index[token].append(i)
+    return lower_texts, dict(token_index)
+
+
+def _text_search_candidates(ctx: APIContext, query_lower: str) -> list[int] | range:
+    """Get indices of blocks that could contain the query as a substring.
+
+    Only the query's inner tokens are whole tokens in any matching text (the
+    first and last may be cut off mid-word), so those are the ones looked up.
+    """
+    inner_tokens = query_lower.split()[1:-1]
+    if not inner_tokens:
+        return range(len(ctx.lower_texts))
+
+    postings = sorted((ctx.token_index.get(t, []) for t in set(inner_tokens)), key=len)
+    candidates = set(postings[0])
+    for posting in postings[1:]:
+        candidates.intersection_update(posting)
+    return sorted(candidates)
+
+
+def _summary_for(ctx: APIContext, block: SpecBlock) -> BlockSummary:
+    """Get a block's summary, reusing the context's copy if the block is unchanged.
+
+    Vector stores return their own SpecBlock copies, so the cached summary is
+    only used when the stored block still equals the loaded one.
+    """
+    position = ctx.id_index.get(block.id)
+    if position is not None and ctx.blocks[position] == block:
+        return ctx.summaries[position]
+    return BlockSummary.from_spec_block(block)
+
+
+def _not_modified(request: Request, ctx: APIContext) -> Response | None:
+    """Get a 304 response if the client's If-None-Match matches the context ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if ctx.etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": ctx.etag})
+    return None
+
+
+def _list_filter_key(
+    status: str | None, block_type: str | None
+) -> tuple[str | None, str | None] | None:
+    """Normalize /blocks filters to a cache key.
+
+    Returns:
+        (status, type) with None for "no filter", or None if either value is
+        invalid (those requests are not cached, so user input cannot grow the
+        cache)
+    """
+    key: list[str | None] = []
+    for value, enum_cls in ((status, SpecStatus), (block_type, SpecType)):
+        if not value or value.lower() == "all":
+            key.append(None)
+            continue
+        try:
+            key.append(enum_cls(value.lower()).value)
+        except ValueError:
+            return None
+    return key[0], key[1]
 
 
 def get_blocks() -> list[SpecBlock]:
     """Get current blocks."""
-    return _blocks
+    return _ctx.blocks
 
 
 @router.get("/blocks", response_model=BlockListResponse)
 async def list_blocks(
+    request: Request,
     status: str | None = Query(None, description="Filter by status: active, legacy, or all"),
     type: str | None = Query(None, description="Filter by type: requirement, design, task, etc."),
-) -> BlockListResponse:
-    """List all blocks with optional filters."""
-    filtered = filter_blocks(_blocks, status=status, block_type=type)
-    total, active_count, legacy_count, pinned_count = calculate_counts(filtered)
+    ctx: APIContext = Depends(get_context),
+) -> Response:
+    """List all blocks with optional filters.
 
-    return BlockListResponse(
-        blocks=[BlockSummary.from_spec_block(b) for b in filtered],
-        total=total,
-        active_count=active_count,
-        legacy_count=legacy_count,
-        pinned_count=pinned_count,
-    )
+    Bodies for every valid filter are serialized in set_context, so listings
+    do no per-block work. Clients holding the current ETag get a 304.
+    """
+    if (not_modified := _not_modified(request, ctx)) is not None:
+        return not_modified
+
+    key = _list_filter_key(status, type)
+    if key is not None:
+        body = ctx.list_bodies[key]
+    else:
+        # Invalid filters are answered but never stored
+        body = _build_list_body(ctx.columns, ctx.summary_json, status, type)
+    return Response(content=body, media_type="application/json", headers={"ETag": ctx.etag})
 
 
 @router.get("/blocks/{block_id}", response_model=BlockDetail)
-async def get_block(block_id: str) -> BlockDetail:
+async def get_block(block_id: str, ctx: APIContext = Depends(get_context)) -> BlockDetail:
     """Get a single block by ID."""
-    for block in _blocks:
-        if block.id == block_id:
-            return BlockDetail.from_spec_block(block)
-    raise HTTPException(status_code=404, detail=f"Block not found: {block_id}")
+    position = ctx.id_index.get(block_id)
+    if position is None:
+        raise HTTPException(status_code=404, detail=f"Block not found: {block_id}")
+    return BlockDetail.from_spec_block(ctx.blocks[position])
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats() -> StatsResponse:
-    """Get memory statistics."""
-    total, active_count, legacy_count, pinned_count = calculate_counts(_blocks)
-    by_type = count_by_type(_blocks)
-    by_source = count_by_source(_blocks)
+async def get_stats(request: Request, ctx: APIContext = Depends(get_context)) -> Response:
+    """Get memory statistics.
 
-    # Estimate memory size (rough approximation)
-    memory_size = sum(len(b.text.encode("utf-8")) for b in _blocks)
-
-    return StatsResponse(
-        total_blocks=total,
-        active_count=active_count,
-        legacy_count=legacy_count,
-        pinned_count=pinned_count,
-        by_type=by_type,
-        by_source=by_source,
-        memory_size_bytes=memory_size,
+    The response is serialized once per context, as it only depends on the blocks.
+    Clients holding the current ETag get a 304.
+    """
+    if (not_modified := _not_modified(request, ctx)) is not None:
+        return not_modified
+    return Response(
+        content=ctx.stats_json, media_type="application/json", headers={"ETag": ctx.etag}
     )
 
 
@@ -135,42 +387,60 @@ async def get_stats() -> StatsResponse:
 async def search_blocks(
     q: str = Query(..., description="Search query"),
     limit: int = Query(10, ge=1, le=100, description="Maximum results"),
+    ctx: APIContext = Depends(get_context),
 ) -> SearchResponse:
     """Semantic search for blocks."""
-    if not _vector_store:
+    if not ctx.vector_store:
         # Fallback to simple text search if no vector store
-        results = []
         query_lower = q.lower()
-        for block in _blocks:
-            if query_lower in block.text.lower():
-                # Simple relevance: position-based score
-                pos = block.text.lower().find(query_lower)
-                score = 1.0 - (pos / len(block.text)) if pos >= 0 else 0.0
-                results.append(
-                    SearchResult(
-                        block=BlockSummary.from_spec_block(block),
-                        score=score,
-                    )
-                )
-        # Sort by score descending
-        results.sort(key=lambda r: r.score, reverse=True)
-        return SearchResponse(results=results[:limit], query=q)
+        candidates = _text_search_candidates(ctx, query_lower)
+        positions = np.fromiter(
+            (ctx.lower_texts[i].find(query_lower) for i in candidates),
+            dtype=np.int64,
+            count=len(candidates),
+        )
+        matched = np.flatnonzero(positions >= 0)
+        indices = (
+            matched
+            if isinstance(candidates, range)
+            else np.asarray(candidates, dtype=np.intp)[matched]
+        )
+
+        # Simple relevance: position-based score, computed for all matches at once
+        scores = 1.0 - positions[matched] / ctx.text_lengths[indices]
+
+        # Sort by score descending (stable, so ties keep block order) and only
+        # build response models for the results that are returned
+        top = np.argsort(-scores, kind="stable")[:limit]
+        results = [
+            SearchResult(
+                block=ctx.summaries[indices[j]],
+                score=float(scores[j]),
+            )
+            for j in top
+        ]
+        return SearchResponse(results=results, query=q)
 
     # Use vector store for semantic search
     try:
-        from specmem.vectordb.embeddings import LocalEmbeddingProvider
+        cache_key = (q, limit)
+        query_results = _query_cache.get(cache_key)
+        if query_results is None:
+            from specmem.vectordb.embeddings import LocalEmbeddingProvider
 
-        # Generate embedding for query text
-        embedding_provider = LocalEmbeddingProvider()
-        query_embedding = embedding_provider.embed([q])[0]
+            # Generate embedding for query text
+            embedding_provider = LocalEmbeddingProvider()
+            query_embedding = embedding_provider.embed([q])[0]
+
+            # Query with embedding vector
+            query_results = ctx.vector_store.query(query_embedding, top_k=limit)
+            _query_cache.set(cache_key, query_results)
 
-        # Query with embedding vector
-        query_results = _vector_store.query(query_embedding, top_k=limit)
         results = []
         for result in query_results:
             results.append(
                 SearchResult(
-                    block=BlockSummary.from_spec_block(result.block),
+                    block=_summary_for(ctx, result.block),
                     score=result.score,
                 )
             )
@@ -182,32 +452,23 @@ async def search_blocks(
 
 
 @router.get("/pinned", response_model=PinnedListResponse)
-async def get_pinned() -> PinnedListResponse:
-    """Get all pinned blocks."""
-    pinned = get_pinned_blocks(_blocks)
-
-    responses = []
-    for block in pinned:
-        reason = "Contains critical specification keyword (SHALL)"
-        if "requirement" in block.type.value.lower():
-            reason = "Core requirement specification"
-        elif "design" in block.type.value.lower():
-            reason = "Architecture decision"
-
-        responses.append(
-            PinnedBlockResponse(
-                block=BlockSummary.from_spec_block(block),
-                reason=reason,
-            )
-        )
+async def get_pinned(request: Request, ctx: APIContext = Depends(get_context)) -> Response:
+    """Get all pinned blocks.
 
-    return PinnedListResponse(blocks=responses, total=len(responses))
+    The response is serialized once per context, as it only depends on the blocks.
+    Clients holding the current ETag get a 304.
+    """
+    if (not_modified := _not_modified(request, ctx)) is not None:
+        return not_modified
+    return Response(
+        content=ctx.pinned_json, media_type="application/json", headers={"ETag": ctx.etag}
+    )
 
 
 @router.post("/export", response_model=ExportResponse)
-async def export_pack() -> ExportResponse:
+async def export_pack(ctx: APIContext = Depends(get_context)) -> ExportResponse:
     """Export Agent Experience Pack."""
-    if not _pack_builder:
+    if not ctx.pack_builder:
         return ExportResponse(
             success=False,
             output_path="",
@@ -215,8 +476,10 @@ async def export_pack() -> ExportResponse:
         )
 
     try:
-        output_path = _workspace_path / ".specmem"
-        _pack_builder.build(_blocks, output_path)
+        output_path = ctx.workspace_path / ".specmem"
+        # Build off the event loop so other requests are served meanwhile
+        async with _export_lock:
+            await asyncio.to_thread(ctx.pack_builder.build, ctx.blocks, output_path)
         return ExportResponse(
             success=True,
             output_path=str(output_path),
@@ -231,9 +494,9 @@ async def export_pack() -> ExportResponse:
 
 
 @router.get("/healthz")
-async def health_check():
+async def health_check(ctx: APIContext = Depends(get_context)):
     """Health check endpoint for liveness probes."""
-    return {"status": "ok", "blocks_loaded": len(_blocks)}
+    return {"status": "ok", "blocks_loaded": len(ctx.blocks)}
 
 
 @router.post("/cache/clear")
@@ -275,7 +538,7 @@ async def get_spec_file(feature_name: str, file_type: str) -> SpecFileResponse:
             detail=f"Invalid file_type: {file_type}. Must be 'requirements', 'design', or 'tasks'",
         )
 
-    file_path = _workspace_path / ".kiro" / "specs" / feature_name / f"{file_type}.md"
+    file_path = _ctx.workspace_path / ".kiro" / "specs" / feature_name / f"{file_type}.md"
 
     if not file_path.exists():
         return SpecFileResponse(
@@ -360,7 +623,7 @@ async def get_coverage() -> CoverageResponse:
     try:
         from specmem.coverage.engine import CoverageEngine
 
-        engine = CoverageEngine(_workspace_path)
+        engine = CoverageEngine(_ctx.workspace_path)
         result = engine.analyze_coverage()
 
         features = []
@@ -422,7 +685,7 @@ async def get_coverage_suggestions(
     try:
         from specmem.coverage.engine import CoverageEngine
 
-        engine = CoverageEngine(_workspace_path)
+        engine = CoverageEngine(_ctx.workspace_path)
         suggestions = engine.get_suggestions(feature_name=feature)
 
         return [
@@ -508,7 +771,7 @@ async def list_sessions(
         indexer = SessionIndexer(storage)
         indexer.index_sessions()
 
-        workspace = str(_workspace_path) if workspace_only else None
+        workspace = str(_ctx.workspace_path) if workspace_only else None
         sessions = storage.list_sessions(workspace=workspace, limit=limit)
 
         return SessionListResponse(
@@ -656,7 +919,7 @@ class PowerListResponse(BaseModel):
 async def list_powers() -> PowerListResponse:
     """List installed Kiro Powers."""
     try:
-        powers_dir = _workspace_path / ".kiro" / "powers"
+        powers_dir = _ctx.workspace_path / ".kiro" / "powers"
         if not powers_dir.exists():
             return PowerListResponse(powers=[], total=0)
 
@@ -694,7 +957,7 @@ async def list_powers() -> PowerListResponse:
 @router.get("/powers/{power_name}")
 async def get_power(power_name: str) -> PowerResponse:
     """Get details for a specific Power."""
-    powers_dir = _workspace_path / ".kiro" / "powers" / power_name
+    powers_dir = _ctx.workspace_path / ".kiro" / "powers" / power_name
     if not powers_dir.exists():
         raise HTTPException(status_code=404, detail=f"Power not found: {power_name}")
 
@@ -762,7 +1025,7 @@ async def get_health_score() -> HealthScoreResponse:
     try:
         from specmem.health.engine import HealthScoreEngine
 
-        engine = HealthScoreEngine(_workspace_path)
+        engine = HealthScoreEngine(_ctx.workspace_path)
         score = engine.calculate()
 
         response = HealthScoreResponse(
@@ -846,7 +1109,7 @@ async def get_impact_graph(
         from specmem.graph.builder import ImpactGraphBuilder
         from specmem.graph.models import NodeType
 
-        builder = ImpactGraphBuilder(_workspace_path)
+        builder = ImpactGraphBuilder(_ctx.workspace_path)
         graph = builder.build()
 
         # Apply type filter if specified
@@ -914,12 +1177,12 @@ async def action_scan() -> ActionResultResponse:
     try:
         from specmem.adapters import detect_adapters
 
-        adapters = detect_adapters(_workspace_path)
+        adapters = detect_adapters(_ctx.workspace_path)
         total_blocks = 0
         adapter_results = {}
 
         for adapter in adapters:
-            blocks = adapter.load(_workspace_path)
+            blocks = adapter.load(_ctx.workspace_path)
             adapter_results[adapter.__class__.__name__] = len(blocks)
             total_blocks += len(blocks)
 
@@ -950,7 +1213,7 @@ async def action_build() -> ActionResultResponse:
         from specmem.agentx.pack_builder import PackBuilder
 
         adapter = KiroAdapter()
-        if not adapter.detect(_workspace_path):
+        if not adapter.detect(_ctx.workspace_path):
             return ActionResultResponse(
                 success=False,
                 action="build",
@@ -958,9 +1221,9 @@ async def action_build() -> ActionResultResponse:
                 error="No Kiro specs detected in workspace",
             )
 
-        blocks = adapter.load(_workspace_path)
+        blocks = adapter.load(_ctx.workspace_path)
         builder = PackBuilder()
-        output_path = _workspace_path / ".specmem"
+        output_path = _ctx.workspace_path / ".specmem"
         builder.build(blocks, output_path)
 
         return ActionResultResponse(
@@ -988,7 +1251,7 @@ async def action_validate() -> ActionResultResponse:
     try:
         from specmem.validator.engine import SpecValidator
 
-        validator = SpecValidator(_workspace_path)
+        validator = SpecValidator(_ctx.workspace_path)
         results = validator.validate_all()
 
         total_issues = sum(len(r.issues) for r in results)
@@ -1032,7 +1295,7 @@ async def action_coverage() -> ActionResultResponse:
     try:
         from specmem.coverage.engine import CoverageEngine
 
-        engine = CoverageEngine(_workspace_path)
+        engine = CoverageEngine(_ctx.workspace_path)
         result = engine.analyze_coverage()
 
         return ActionResultResponse(
@@ -1063,7 +1326,7 @@ async def action_query(
     """Execute query action."""
     try:
         # Use the existing search functionality
-        search_response = await search_blocks(q=q, limit=5)
+        search_response = await search_blocks(q=q, limit=5, ctx=_ctx)
 
         return ActionResultResponse(
             success=True,
@@ -1217,7 +1480,7 @@ async def get_lifecycle_health(
     try:
         from specmem.lifecycle import HealthAnalyzer
 
-        spec_base = _workspace_path / ".kiro" / "specs"
+        spec_base = _ctx.workspace_path / ".kiro" / "specs"
 
         if not spec_base.exists():
             return LifecycleHealthResponse(
@@ -1279,7 +1542,7 @@ async def get_spec_health(
     try:
         from specmem.lifecycle import HealthAnalyzer
 
-        spec_base = _workspace_path / ".kiro" / "specs"
+        spec_base = _ctx.workspace_path / ".kiro" / "specs"
         spec_path = spec_base / spec_name
 
         if not spec_path.exists():
@@ -1317,8 +1580,8 @@ async def prune_specs(request: PruneRequest) -> PruneResponse:
     try:
         from specmem.lifecycle import HealthAnalyzer, PrunerEngine
 
-        spec_base = _workspace_path / ".kiro" / "specs"
-        archive_dir = _workspace_path / ".specmem" / "archive"
+        spec_base = _ctx.workspace_path / ".kiro" / "specs"
+        archive_dir = _ctx.workspace_path / ".specmem" / "archive"
 
         if not spec_base.exists():
             return PruneResponse(
@@ -1408,7 +1671,7 @@ async def generate_specs(request: GenerateRequest) -> GenerateResponse:
     try:
         from specmem.lifecycle import GeneratorEngine
 
-        output_dir = _workspace_path / ".kiro" / "specs"
+        output_dir = _ctx.workspace_path / ".kiro" / "specs"
 
         generator = GeneratorEngine(
             default_format=request.format,
@@ -1420,7 +1683,7 @@ async def generate_specs(request: GenerateRequest) -> GenerateResponse:
         for file_arg in request.files:
             file_path = Path(file_arg)
             if not file_path.is_absolute():
-                file_path = _workspace_path / file_path
+                file_path = _ctx.workspace_path / file_path
 
             if not file_path.exists():
                 continue
@@ -1471,8 +1734,8 @@ async def compress_specs(request: CompressRequest) -> CompressResponse:
     try:
         from specmem.lifecycle import CompressorEngine
 
-        spec_base = _workspace_path / ".kiro" / "specs"
-        compressed_dir = _workspace_path / ".specmem" / "compressed"
+        spec_base = _ctx.workspace_path / ".kiro" / "specs"
+        compressed_dir = _ctx.workspace_path / ".specmem" / "compressed"
 
         if not spec_base.exists():
             return CompressResponse(
@@ -1627,7 +1890,7 @@ async def get_kiro_config() -> KiroConfigResponse:
     try:
         from specmem.kiro.indexer import KiroConfigIndexer
 
-        indexer = KiroConfigIndexer(_workspace_path)
+        indexer = KiroConfigIndexer(_ctx.workspace_path)
         indexer.index_all()
         summary = indexer.get_summary()
 
@@ -1732,7 +1995,7 @@ async def get_guidelines(
     try:
         from specmem.guidelines.aggregator import GuidelinesAggregator
 
-        aggregator = GuidelinesAggregator(_workspace_path)
+        aggregator = GuidelinesAggregator(_ctx.workspace_path)
 
         if source:
             guidelines = aggregator.filter_by_source(source)
@@ -1799,7 +2062,7 @@ async def convert_guideline(request: ConvertRequest) -> ConversionResultResponse
                 detail=f"Invalid format: {request.format}. Valid formats: steering, claude, cursor",
             )
 
-        aggregator = GuidelinesAggregator(_workspace_path)
+        aggregator = GuidelinesAggregator(_ctx.workspace_path)
         response = aggregator.get_all(include_samples=True)
 
         # Find the guideline by ID
@@ -1822,7 +2085,7 @@ async def convert_guideline(request: ConvertRequest) -> ConversionResultResponse
 
             # Write file if not preview
             if not request.preview:
-                steering_dir = _workspace_path / ".kiro" / "steering"
+                steering_dir = _ctx.workspace_path / ".kiro" / "steering"
                 converter.write_steering_files([result], steering_dir)
         elif request.format == "claude":
             content = converter.to_claude([guideline])
@@ -1830,14 +2093,14 @@ async def convert_guideline(request: ConvertRequest) -> ConversionResultResponse
             frontmatter = {}
 
             if not request.preview:
-                (_workspace_path / filename).write_text(content, encoding="utf-8")
+                (_ctx.workspace_path / filename).write_text(content, encoding="utf-8")
         else:  # cursor
             content = converter.to_cursor([guideline])
             filename = ".cursorrules"
             frontmatter = {}
 
             if not request.preview:
-                (_workspace_path / filename).write_text(content, encoding="utf-8")
+                (_ctx.workspace_path / filename).write_text(content, encoding="utf-8")
 
         return ConversionResultResponse(
             filename=filename,
@@ -1865,7 +2128,7 @@ async def export_guidelines(request: ExportRequest) -> ExportResultResponse:
         from specmem.guidelines.aggregator import GuidelinesAggregator
         from specmem.guidelines.converter import GuidelinesConverter
 
-        aggregator = GuidelinesAggregator(_workspace_path)
+        aggregator = GuidelinesAggregator(_ctx.workspace_path)
         response = aggregator.get_all(include_samples=False)
 
         if not response.guidelines:
@@ -1,12 +1,120 @@
 """Filter and query logic for SpecMem Web UI."""
 
+from collections import Counter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
 from specmem.core.specir import SpecBlock, SpecStatus, SpecType
 
 
+# Small integer codes used by BlockColumns
+_STATUS_CODES: dict[SpecStatus, int] = {s: i for i, s in enumerate(SpecStatus)}
+_TYPE_CODES: dict[SpecType, int] = {t: i for i, t in enumerate(SpecType)}
+
+
+def _filter_code(
+    value: str | None, enum_cls: type[SpecStatus] | type[SpecType], codes: dict[Any, int]
+) -> int | None:
+    """Resolve a status/type filter string to its integer code.
+
+    Returns:
+        The code, or None if the filter is unset or 'all'
+
+    Raises:
+        ValueError: If the value is not a valid member
+    """
+    if not value or value.lower() == "all":
+        return None
+    return codes[enum_cls(value.lower())]
+
+
+class BlockColumns:
+    """Column-wise view of a block list for vectorized filtering.
+
+    Status and type are stored as integer codes and the pinned flag as a
+    boolean array, so filters and counts run as NumPy mask operations
+    instead of per-block attribute access. A combined status/type code lets
+    a two-field filter run as a single comparison. Build it once per block
+    list.
+    """
+
+    def __init__(self, blocks: list[SpecBlock]) -> None:
+        """Encode the filterable fields of the blocks.
+
+        Args:
+            blocks: List of SpecBlocks, in the order used for indexing
+        """
+        count = len(blocks)
+        self.status: npt.NDArray[np.int8] = np.fromiter(
+            (_STATUS_CODES[b.status] for b in blocks), dtype=np.int8, count=count
+        )
+        self.type: npt.NDArray[np.int8] = np.fromiter(
+            (_TYPE_CODES[b.type] for b in blocks), dtype=np.int8, count=count
+        )
+        self.pinned: npt.NDArray[np.bool_] = np.fromiter(
+            (b.pinned for b in blocks), dtype=np.bool_, count=count
+        )
+        self.status_type: npt.NDArray[np.int16] = (
+            self.status.astype(np.int16) * len(_TYPE_CODES) + self.type
+        )
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def mask(
+        self, status: str | None = None, block_type: str | None = None
+    ) -> npt.NDArray[np.bool_]:
+        """Build a boolean mask of blocks matching the filters (AND logic).
+
+        Args:
+            status: Filter by status ('active', 'legacy', or None/'' for all)
+            block_type: Filter by type ('requirement', 'design', etc., or None/'' for all)
+
+        Returns:
+            Boolean array with one entry per block; all False for an
+            invalid status or type
+        """
+        try:
+            status_code = _filter_code(status, SpecStatus, _STATUS_CODES)
+            type_code = _filter_code(block_type, SpecType, _TYPE_CODES)
+        except ValueError:
+            return np.zeros(len(self), dtype=np.bool_)
+
+        if status_code is None and type_code is None:
+            return np.ones(len(self), dtype=np.bool_)
+        if type_code is None:
+            return np.asarray(self.status == status_code, dtype=np.bool_)
+        if status_code is None:
+            return np.asarray(self.type == type_code, dtype=np.bool_)
+        return np.asarray(
+            self.status_type == status_code * len(_TYPE_CODES) + type_code, dtype=np.bool_
+        )
+
+    def counts(self, mask: npt.NDArray[np.bool_]) -> tuple[int, int, int, int]:
+        """Calculate counts for the blocks selected by a mask.
+
+        Args:
+            mask: Boolean mask from mask()
+
+        Returns:
+            Tuple of (total, active_count, legacy_count, pinned_count)
+        """
+        status = self.status[mask]
+        return (
+            int(np.count_nonzero(mask)),
+            int(np.count_nonzero(status == _STATUS_CODES[SpecStatus.ACTIVE])),
+            int(np.count_nonzero(status == _STATUS_CODES[SpecStatus.LEGACY])),
+            int(np.count_nonzero(self.pinned[mask])),
+        )
+
+
 def filter_blocks(
     blocks: list[SpecBlock],
     status: str | None = None,
     block_type: str | None = None,
+    columns: BlockColumns | None = None,
 ) -> list[SpecBlock]:
     """Filter blocks by status and/or type with AND logic.
 
@@ -14,10 +122,15 @@ def filter_blocks(
         blocks: List of SpecBlocks to filter
         status: Filter by status ('active', 'legacy', or None/'' for all)
         block_type: Filter by type ('requirement', 'design', etc., or None/'' for all)
+        columns: Precomputed BlockColumns for blocks; when given, the
+            filter is evaluated as a vectorized mask
 
     Returns:
         Filtered list of SpecBlocks matching all specified criteria
     """
+    if columns is not None:
+        return [blocks[i] for i in np.flatnonzero(columns.mask(status, block_type))]
+
     result = blocks
 
     # Filter by status
@@ -89,13 +202,62 @@ def count_by_source(blocks: list[SpecBlock]) -> dict[str, int]:
     return counts
 
 
-def get_pinned_blocks(blocks: list[SpecBlock]) -> list[SpecBlock]:
+def compute_stats(blocks: list[SpecBlock], memory_size_bytes: int | None = None) -> dict[str, Any]:
+    """Compute all memory statistics in a single pass over the blocks.
+
+    Equivalent to combining calculate_counts, count_by_type and
+    count_by_source with a UTF-8 size estimate, without walking the list
+    once per aggregate.
+
+    Args:
+        blocks: List of SpecBlocks
+        memory_size_bytes: Precomputed UTF-8 size of the block texts; when
+            given, the texts are not re-encoded
+
+    Returns:
+        Dictionary with the fields of StatsResponse
+    """
+    active_count = legacy_count = pinned_count = memory_size = 0
+    measure_size = memory_size_bytes is None
+    by_type: Counter[str] = Counter()
+    by_source: Counter[str] = Counter()
+
+    for block in blocks:
+        if block.status == SpecStatus.ACTIVE:
+            active_count += 1
+        elif block.status == SpecStatus.LEGACY:
+            legacy_count += 1
+        if block.pinned:
+            pinned_count += 1
+        by_type[block.type.value] += 1
+        by_source[block.source] += 1
+        if measure_size:
+            memory_size += len(block.text.encode("utf-8"))
+
+    return {
+        "total_blocks": len(blocks),
+        "active_count": active_count,
+        "legacy_count": legacy_count,
+        "pinned_count": pinned_count,
+        "by_type": dict(by_type),
+        "by_source": dict(by_source),
+        "memory_size_bytes": memory_size if measure_size else memory_size_bytes,
+    }
+
+
+def get_pinned_blocks(
+    blocks: list[SpecBlock], pinned_index: np.ndarray | None = None
+) -> list[SpecBlock]:
     """Get all pinned blocks.
 
     Args:
         blocks: List of SpecBlocks
+        pinned_index: Precomputed positions of the pinned blocks, e.g.
+            np.flatnonzero(BlockColumns.pinned); when given, blocks are not scanned
 
     Returns:
         List of pinned SpecBlocks
     """
+    if pinned_index is not None:
+        return [blocks[i] for i in pinned_index]
     return [b for b in blocks if b.pinned]
@@ -137,7 +137,12 @@ class AgentVectorDBStore(VectorStore):
 
         return min(1.0, max(0.0, score))
 
-    def store(self, blocks: list[SpecBlock], embeddings: list[list[float]]) -> None:
+    def store(
+        self,
+        blocks: list[SpecBlock],
+        embeddings: list[list[float]],
+        content_hashes: list[str] | None = None,
+    ) -> None:
         self._ensure_initialized()
 
         if len(blocks) != len(embeddings):
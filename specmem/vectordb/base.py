@@ -6,6 +6,7 @@ by SpecMem for storing and querying SpecBlocks.
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -14,6 +15,7 @@ from specmem.core.specir import SpecStatus, SpecType
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from datetime import datetime
 
     from specmem.core.specir import SpecBlock
@@ -28,6 +30,20 @@ VALID_TRANSITIONS: dict[SpecStatus, set[SpecStatus]] = {
 }
 
 
+def block_content_hash(block: SpecBlock, embedding_model: str = "") -> str:
+    """Hash of the block fields and embedding model that determine its embedding.
+
+    Args:
+        block: SpecBlock to hash
+        embedding_model: Identifier of the embedding space (provider, model
+            and dimension), so vectors from another model never match
+
+    Returns:
+        Hex SHA-256 digest of the embedding model, block ID and text
+    """
+    return hashlib.sha256(f"{embedding_model}\0{block.id}\0{block.text}".encode()).hexdigest()
+
+
 @dataclass
 class GovernanceRules:
     """Rules for controlling memory retrieval.
@@ -125,12 +141,19 @@ class VectorStore(ABC):
         pass
 
     @abstractmethod
-    def store(self, blocks: list[SpecBlock], embeddings: list[list[float]]) -> None:
+    def store(
+        self,
+        blocks: list[SpecBlock],
+        embeddings: list[list[float]],
+        content_hashes: list[str] | None = None,
+    ) -> None:
         """Store SpecBlocks with their embeddings.
 
         Args:
             blocks: List of SpecBlock instances to store
             embeddings: Corresponding embedding vectors (same length as blocks)
+            content_hashes: Optional content hash of each block, recorded by
+                backends that support get_stored_embeddings()
 
         Raises:
             VectorStoreError: If storage fails
@@ -250,3 +273,36 @@ class VectorStore(ABC):
         Use with caution - this is destructive.
         """
         pass
+
+    def get_stored_embeddings(self, content_hashes: Collection[str]) -> dict[str, list[float]]:
+        """Get stored embeddings for blocks whose content is unchanged.
+
+        Backends that don't record content hashes keep this default, so
+        every block is re-embedded.
+
+        Args:
+            content_hashes: Current content hashes of the blocks
+
+        Returns:
+            Map of content hash to stored embedding, for the hashes that
+            are stored
+        """
+        return {}
+
+    def ensure_index(self) -> bool:
+        """Create an approximate nearest neighbor index if one is worthwhile.
+
+        Backends that manage their own indexing keep this default no-op.
+
+        Returns:
+            True if an index was created
+        """
+        return False
+
+    def rebuild_index(self) -> bool:
+        """Rebuild the approximate nearest neighbor index from scratch.
+
+        Returns:
+            True if an index was built
+        """
+        return False
@@ -102,7 +102,12 @@ class ChromaDBStore(VectorStore):
         if not self._initialized:
             self.initialize()
 
-    def store(self, blocks: list[SpecBlock], embeddings: list[list[float]]) -> None:
+    def store(
+        self,
+        blocks: list[SpecBlock],
+        embeddings: list[list[float]],
+        content_hashes: list[str] | None = None,
+    ) -> None:
         """Store blocks with embeddings in ChromaDB."""
         self._ensure_initialized()
 
@@ -12,10 +12,12 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import lancedb
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from specmem.core.exceptions import LifecycleError, VectorStoreError
 from specmem.core.specir import SpecBlock, SpecStatus, SpecType
@@ -25,12 +27,33 @@ from specmem.vectordb.base import (
     GovernanceRules,
     QueryResult,
     VectorStore,
+    block_content_hash,
     validate_transition,
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from lancedb.query import LanceQueryBuilder, LanceVectorQueryBuilder
+
+
 logger = logging.getLogger(__name__)
 
+# Schema metadata marking a table whose vectors are stored unit-length
+_NORMALIZED_KEY = b"normalized"
+
+# Distance metrics the store accepts, a subset of LanceDB's distance types
+Metric = Literal["l2", "dot"]
+
+
+def _normalize_rows(vectors: Any) -> np.ndarray:
+    """L2-normalize each row of a 2-D array of vectors."""
+    array = np.array(vectors, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    array /= np.clip(norms, 1e-12, None)
+    return array
+
 
 class LanceDBStore(VectorStore):
     """LanceDB implementation using DiskANN for fast vector search.
@@ -42,13 +65,30 @@ class LanceDBStore(VectorStore):
     TABLE_NAME = "specblocks"
     AUDIT_TABLE_NAME = "audit_log"
 
-    def __init__(self, db_path: str = ".specmem/vectordb") -> None:
+    # Below this many rows a brute-force scan is fast enough to skip the ANN index
+    ANN_INDEX_MIN_ROWS = 1000
+    ANN_NUM_SUB_VECTORS = 16
+
+    METRICS = ("l2", "dot")
+
+    def __init__(self, db_path: str = ".specmem/vectordb", metric: str = "l2") -> None:
         """Initialize LanceDB store.
 
         Args:
             db_path: Path to store the LanceDB database
+            metric: Distance metric, "l2" or "dot". With "dot", vectors are
+                normalized when stored so search is a plain inner product
+                that ranks like cosine similarity.
         """
+        if metric not in self.METRICS:
+            raise VectorStoreError(
+                f"Unsupported metric: {metric}",
+                code="LANCEDB_INVALID_METRIC",
+                details={"metric": metric, "supported": list(self.METRICS)},
+            )
+
         self.db_path = db_path
+        self.metric = cast("Metric", metric)
         self.db: lancedb.DBConnection | None = None
         self.table: lancedb.table.Table | None = None
         self.audit_table: lancedb.table.Table | None = None
@@ -67,6 +107,8 @@ class LanceDBStore(VectorStore):
             if self.TABLE_NAME in self.db.table_names():
                 self.table = self.db.open_table(self.TABLE_NAME)
                 logger.info(f"Opened existing LanceDB table: {self.TABLE_NAME}")
+                if self.metric == "dot" and not self._is_normalized():
+                    self._normalize_table()
 
             if self.AUDIT_TABLE_NAME in self.db.table_names():
                 self.audit_table = self.db.open_table(self.AUDIT_TABLE_NAME)
@@ -86,7 +128,38 @@ class LanceDBStore(VectorStore):
         if not self._initialized:
             self.initialize()
 
+    def _get_db(self) -> lancedb.DBConnection:
+        if self.db is None:
+            raise VectorStoreError("LanceDB is not initialized", code="LANCEDB_NOT_INITIALIZED")
+        return self.db
+
+    def _is_normalized(self) -> bool:
+        if self.table is None:
+            return True
+        metadata = self.table.schema.metadata or {}
+        return metadata.get(_NORMALIZED_KEY) == b"true"
+
+    def _normalize_table(self) -> None:
+        """Rewrite a table stored without normalization with unit-length vectors."""
+        if self.db is None or self.table is None:
+            return
+
+        data = self.table.to_arrow()
+        vector_field = data.schema.field("vector")
+        vector_dim = vector_field.type.list_size
+
+        if data.num_rows:
+            flat = data.column("vector").combine_chunks().flatten().to_numpy(zero_copy_only=False)
+            vectors = _normalize_rows(flat.reshape(-1, vector_dim))
+            column = pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), vector_dim)
+            data = data.set_column(data.schema.get_field_index("vector"), vector_field, column)
+
+        data = data.replace_schema_metadata({_NORMALIZED_KEY: b"true"})
+        self.table = self.db.create_table(name=self.TABLE_NAME, data=data, mode="overwrite")
+        logger.info(f"Normalized {data.num_rows} stored vectors for dot-product search")
+
     def _get_schema(self, vector_dim: int) -> pa.Schema:
+        metadata = {_NORMALIZED_KEY: b"true"} if self.metric == "dot" else None
         return pa.schema(
             [
                 ("id", pa.string()),
@@ -100,7 +173,9 @@ class LanceDBStore(VectorStore):
                 ("vector", pa.list_(pa.float32(), vector_dim)),
                 ("created_at", pa.float64()),
                 ("updated_at", pa.float64()),
-            ]
+                ("content_hash", pa.string()),
+            ],
+            metadata=metadata,
         )
 
     def _get_audit_schema(self, vector_dim: int) -> pa.Schema:
@@ -122,10 +197,17 @@ class LanceDBStore(VectorStore):
             ]
         )
 
-    def store(self, blocks: list[SpecBlock], embeddings: list[list[float]]) -> None:
+    def store(
+        self,
+        blocks: list[SpecBlock],
+        embeddings: list[list[float]],
+        content_hashes: list[str] | None = None,
+    ) -> None:
         self._ensure_initialized()
 
-        if len(blocks) != len(embeddings):
+        if len(blocks) != len(embeddings) or (
+            content_hashes is not None and len(content_hashes) != len(blocks)
+        ):
             raise VectorStoreError(
                 "Number of blocks and embeddings must match",
                 code="MISMATCHED_LENGTHS",
@@ -140,6 +222,11 @@ class LanceDBStore(VectorStore):
             self._vector_dim = vector_dim
             now = datetime.now().timestamp()
 
+            # Normalize once here so queries don't pay for it per vector
+            vectors = _normalize_rows(embeddings) if self.metric == "dot" else embeddings
+            if content_hashes is None:
+                content_hashes = [block_content_hash(block) for block in blocks]
+
             data = [
                 {
                     "id": block.id,
@@ -153,12 +240,15 @@ class LanceDBStore(VectorStore):
                     "vector": embedding,
                     "created_at": now,
                     "updated_at": now,
+                    "content_hash": content_hash,
                 }
-                for block, embedding in zip(blocks, embeddings, strict=False)
+                for block, embedding, content_hash in zip(
+                    blocks, vectors, content_hashes, strict=False
+                )
             ]
 
             schema = self._get_schema(vector_dim)
-            self.table = self.db.create_table(
+            self.table = self._get_db().create_table(
                 name=self.TABLE_NAME,
                 data=data,
                 schema=schema,
@@ -189,7 +279,15 @@ class LanceDBStore(VectorStore):
             return []
 
         try:
-            query_builder = self.table.search(embedding).limit(top_k * 2)
+            query_builder: LanceQueryBuilder
+            if self.metric == "dot":
+                vector_query = cast(
+                    "LanceVectorQueryBuilder",
+                    self.table.search(_normalize_rows(embedding)[0]),
+                )
+                query_builder = vector_query.distance_type("dot").limit(top_k * 2)
+            else:
+                query_builder = self.table.search(embedding).limit(top_k * 2)
 
             # Build status filter - NEVER include obsolete
             status_conditions = ["status != 'obsolete'"]
@@ -352,7 +450,7 @@ class LanceDBStore(VectorStore):
 
             if self.audit_table is None:
                 schema = self._get_audit_schema(vector_dim)
-                self.audit_table = self.db.create_table(
+                self.audit_table = self._get_db().create_table(
                     name=self.AUDIT_TABLE_NAME,
                     data=audit_data,
                     schema=schema,
@@ -408,6 +506,48 @@ class LanceDBStore(VectorStore):
                 details={"error": str(e)},
             ) from e
 
+    def get_stored_embeddings(self, content_hashes: Collection[str]) -> dict[str, list[float]]:
+        self._ensure_initialized()
+
+        # Tables written before content hashes were recorded can't be matched
+        if (
+            not content_hashes
+            or self.table is None
+            or "content_hash" not in self.table.schema.names
+        ):
+            return {}
+
+        try:
+            num_rows = self.table.count_rows()
+            if not num_rows:
+                return {}
+
+            # Match on the hash column alone, then read vectors for the hits only
+            stored_table = self.table.search().select(["content_hash"]).limit(num_rows).to_arrow()
+            stored = stored_table["content_hash"]
+            wanted = pa.array(list(content_hashes), type=pa.string())
+            hits = pc.unique(stored.filter(pc.is_in(stored, value_set=wanted))).to_pylist()
+            if not hits:
+                return {}
+
+            quoted = ", ".join("'" + h.replace("'", "''") + "'" for h in hits)
+            rows = (
+                self.table.search()
+                .where(f"content_hash IN ({quoted})")
+                .select(["content_hash", "vector"])
+                .limit(num_rows)
+                .to_arrow()
+            )
+            vectors = rows["vector"].to_pylist()
+            return dict(zip(rows["content_hash"].to_pylist(), vectors, strict=True))
+
+        except Exception as e:
+            raise VectorStoreError(
+                f"Failed to read stored embeddings: {e}",
+                code="LANCEDB_GET_ERROR",
+                details={"error": str(e)},
+            ) from e
+
     def get_by_id(self, block_id: str) -> SpecBlock | None:
         self._ensure_initialized()
 
@@ -464,7 +604,7 @@ class LanceDBStore(VectorStore):
 
         if self.table is not None:
             try:
-                self.db.drop_table(self.TABLE_NAME)
+                self._get_db().drop_table(self.TABLE_NAME)
                 self.table = None
                 logger.info("Cleared LanceDB table")
             except Exception as e:
@@ -476,11 +616,70 @@ class LanceDBStore(VectorStore):
 
         if self.audit_table is not None:
             try:
-                self.db.drop_table(self.AUDIT_TABLE_NAME)
+                self._get_db().drop_table(self.AUDIT_TABLE_NAME)
                 self.audit_table = None
             except Exception:
                 pass
 
+    def ensure_index(self) -> bool:
+        """Create an IVF-PQ index on the vector column if none exists yet.
+
+        Returns:
+            True if an index was created
+        """
+        return self._create_vector_index(replace=False)
+
+    def rebuild_index(self) -> bool:
+        """Rebuild the IVF-PQ index on the vector column.
+
+        Returns:
+            True if an index was built
+        """
+        return self._create_vector_index(replace=True)
+
+    def _create_vector_index(self, replace: bool) -> bool:
+        self._ensure_initialized()
+
+        if self.table is None:
+            return False
+
+        try:
+            num_rows = self.table.count_rows()
+            if num_rows < self.ANN_INDEX_MIN_ROWS:
+                return False
+
+            if not replace and any(
+                "vector" in index.columns for index in self.table.list_indices()
+            ):
+                return False
+
+            from lancedb.index import IvfPq
+
+            # PQ needs the vector dimension to split evenly into sub-vectors
+            vector_dim = self.table.schema.field("vector").type.list_size
+            num_sub_vectors = (
+                self.ANN_NUM_SUB_VECTORS if vector_dim % self.ANN_NUM_SUB_VECTORS == 0 else None
+            )
+
+            self.table.create_index(
+                "vector",
+                config=IvfPq(
+                    distance_type=self.metric,
+                    num_partitions=min(256, max(1, num_rows // 1000)),
+                    num_sub_vectors=num_sub_vectors,
+                ),
+                replace=True,
+            )
+            logger.info(f"Built vector index over {num_rows} blocks")
+            return True
+
+        except Exception as e:
+            raise VectorStoreError(
+                f"Failed to create vector index: {e}",
+                code="LANCEDB_INDEX_ERROR",
+                details={"error": str(e)},
+            ) from e
+
     def _row_to_specblock(self, row: dict[str, Any]) -> SpecBlock:
         tags = row.get("tags", "")
         links = row.get("links", "")
@@ -114,7 +114,12 @@ class QdrantStore(VectorStore):
         if not self._initialized:
             self.initialize()
 
-    def store(self, blocks: list[SpecBlock], embeddings: list[list[float]]) -> None:
+    def store(
+        self,
+        blocks: list[SpecBlock],
+        embeddings: list[list[float]],
+        content_hashes: list[str] | None = None,
+    ) -> None:
         if len(blocks) != len(embeddings):
             raise VectorStoreError("Mismatched lengths", code="MISMATCHED_LENGTHS")
 
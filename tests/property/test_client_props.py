@@ -3,6 +3,7 @@
 Tests correctness properties defined in the specmem-client-api design document.
 """
 
+import string
 import tempfile
 from pathlib import Path
 
@@ -722,6 +723,126 @@ class TestTokenBudgetCompliance:
             # Should not exceed budget
             assert tokens <= token_budget
 
+    @given(
+        entries=st.lists(
+            st.tuples(
+                st.sampled_from(["requirement", "design", "task"]),
+                st.text(alphabet=string.ascii_lowercase + " ", min_size=1, max_size=40),
+                st.booleans(),
+            ),
+            max_size=9,
+        ),
+        token_budget=st.integers(min_value=1, max_value=80),
+    )
+    @settings(max_examples=200)
+    def test_tldr_truncation_matches_pop_until_fits(
+        self, entries: list[tuple[str, str, bool]], token_budget: int
+    ):
+        """For any entries, TL;DR truncation keeps the same lines as popping until it fits."""
+        from types import SimpleNamespace
+
+        from specmem import SpecMemClient
+        from specmem.context import TokenEstimator
+
+        estimator = TokenEstimator()
+
+        # Reference: drop the second-to-last line and recount until it fits
+        lines = ["Key specifications:"]
+        for spec_type, title, is_pinned in entries[:5]:
+            lines.append(f"- {'📌 ' if is_pinned else ''}[{spec_type}] {title}")
+        if len(entries) > 5:
+            lines.append(f"- ...and {len(entries) - 5} more")
+        expected = "\n".join(lines)
+        while estimator.count_tokens(expected) > token_budget and len(lines) > 2:
+            lines.pop(-2)
+            expected = "\n".join(lines)
+        if not entries:
+            expected = "No specifications available."
+
+        client = SimpleNamespace(_token_estimator=estimator)
+        assert SpecMemClient._generate_tldr(client, entries, token_budget) == expected
+
+
+class TestContextTruncation:
+    """Bulk truncation of context bundles keeps exactly what the drop loop keeps."""
+
+    @given(
+        entries=st.lists(
+            st.tuples(
+                st.sampled_from(["requirement", "task", "design", "decision"]),
+                st.sampled_from([0.2, 0.5, 0.5, 0.9]),
+                st.text(alphabet=string.ascii_lowercase + " ", min_size=1, max_size=300).filter(
+                    lambda x: len(x.strip()) > 0
+                ),
+            ),
+            min_size=1,
+            max_size=12,
+        ),
+        data=st.data(),
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_truncation_matches_drop_until_fits(self, entries, data):
+        """For any summaries and budget, including a budget equal to a
+        reachable total, the bisect cut-off drops the same summaries as
+        dropping the least relevant one and recounting until it fits.
+        """
+        from specmem import SpecMemClient
+        from specmem.core.specir import SpecBlock, SpecType
+
+        # Query results arrive most relevant first
+        relevant = sorted(
+            (
+                (SpecBlock(id=f"b-{i}", type=SpecType(t), text=text, source="spec.md"), score)
+                for i, (t, score, text) in enumerate(entries)
+            ),
+            key=lambda item: -item[1],
+        )
+
+        def reference(bundle, token_budget):
+            specs, designs = list(bundle.specs), list(bundle.designs)
+            total = client._estimate_bundle_tokens(specs, designs, bundle.tldr)
+            totals = [total]
+            while total > token_budget and (specs or designs):
+                if designs and (not specs or designs[-1].relevance < specs[-1].relevance):
+                    designs.pop()
+                else:
+                    specs.pop()
+                total = client._estimate_bundle_tokens(specs, designs, bundle.tldr)
+                totals.append(total)
+            return specs, designs, total, totals
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+            client._find_relevant_blocks = lambda files: list(relevant)
+
+            full = client.get_context_for_change(["src/app.py"], token_budget=10**9)
+            # Every total the drop loop passes through, down to the TL;DR alone
+            *_, reachable = reference(full, -1)
+            token_budget = data.draw(st.sampled_from(reachable)) + data.draw(
+                st.sampled_from([-1, 0, 1])
+            )
+
+            bundle = client.get_context_for_change(["src/app.py"], token_budget=token_budget)
+            specs, designs, total, _ = reference(full, token_budget)
+
+            assert [s.id for s in bundle.specs] == [s.id for s in specs]
+            assert [d.id for d in bundle.designs] == [d.id for d in designs]
+            assert bundle.total_tokens == total
+
+
+class TestBatchTokenCounting:
+    """Batch token counting agrees with counting each text on its own."""
+
+    @given(texts=st.lists(st.text(max_size=200), max_size=20))
+    @settings(max_examples=100)
+    def test_batch_matches_single_counts(self, texts: list[str]):
+        """For any list of texts, batch counts equal per-text counts."""
+        from specmem.context import TokenEstimator
+
+        estimator = TokenEstimator()
+
+        assert estimator.count_tokens_batch(texts) == [estimator.count_tokens(t) for t in texts]
+
 
 class TestQueryResultLimit:
     """**Feature: specmem-client-api, Property 6: Query Result Limit**
@@ -749,6 +870,201 @@ class TestQueryResultLimit:
             assert len(results) <= top_k
 
 
+class TestQueryCache:
+    """Query cache returns stored results and stays within its size bound."""
+
+    @given(
+        keys=st.lists(st.integers(min_value=0, max_value=20), min_size=1, max_size=50),
+        max_size=st.integers(min_value=1, max_value=10),
+    )
+    @settings(max_examples=100)
+    def test_cache_is_bounded_lru(self, keys: list[int], max_size: int):
+        """For any access sequence, the cache keeps the most recent entries."""
+        from specmem.client.query_cache import QueryCache
+
+        cache = QueryCache(max_size=max_size)
+        for key in keys:
+            if cache.get(key) is None:
+                cache.set(key, [key])
+
+        assert len(cache) <= max_size
+        assert cache.get(keys[-1]) == [keys[-1]]
+
+        stats = cache.stats()
+        assert stats["hits"] + stats["misses"] == len(keys) + 1
+
+    def test_expired_entries_are_misses(self):
+        """Entries past their TTL are not returned."""
+        from specmem.client.query_cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=0)
+        cache.set("query", ["result"])
+
+        assert cache.get("query") is None
+        assert len(cache) == 0
+
+
+class _CountingAdapter:
+    """Adapter stub that records how often it is asked to load."""
+
+    name = "counting"
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.calls = 0
+
+    def load(self, repo_path):
+        self.calls += 1
+        return list(self.blocks)
+
+
+def _spec_blocks(count: int):
+    from specmem.core.specir import SpecBlock, SpecType
+
+    return [
+        SpecBlock(
+            id=f"spec-{i}",
+            type=SpecType.REQUIREMENT,
+            text=f"The system SHALL handle case {i}",
+            source="specs/requirements.md",
+        )
+        for i in range(count)
+    ]
+
+
+class TestLazySpecLoading:
+    """Specs load once on first use, a failed load can be retried cleanly,
+    and cached validation results follow the loaded block version.
+    """
+
+    def test_specs_load_once(self, monkeypatch):
+        """Repeated access runs the adapter scan a single time."""
+        from specmem import SpecMemClient
+
+        adapter = _CountingAdapter(_spec_blocks(3))
+        monkeypatch.setattr("specmem.client.client.detect_adapters", lambda path: [adapter])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+            assert adapter.calls == 0
+
+            first = [b.id for b in client.list_specs()]
+            second = [b.id for b in client.list_specs()]
+
+            assert adapter.calls == 1
+            assert first == second == ["spec-0", "spec-1", "spec-2"]
+
+    def test_failed_load_is_retried_without_duplicates(self, monkeypatch):
+        """A load that fails after merging blocks raises MemoryStoreError and
+        the next access reloads from scratch.
+        """
+        from specmem import SpecMemClient
+        from specmem.client.exceptions import MemoryStoreError
+
+        adapter = _CountingAdapter(_spec_blocks(3))
+        monkeypatch.setattr("specmem.client.client.detect_adapters", lambda path: [adapter])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+            index_blocks = client._index_blocks
+            failures = iter([RuntimeError("index failed")])
+
+            def flaky_index_blocks():
+                error = next(failures, None)
+                if error is not None:
+                    raise error
+                index_blocks()
+
+            monkeypatch.setattr(client, "_index_blocks", flaky_index_blocks)
+
+            with pytest.raises(MemoryStoreError, match="index failed"):
+                client.list_specs()
+
+            blocks = client.list_specs()
+
+            assert adapter.calls == 2
+            assert [b.id for b in blocks] == ["spec-0", "spec-1", "spec-2"]
+            assert client.list_specs(type="requirement") == blocks
+
+    def test_adapter_detection_error_is_wrapped(self, monkeypatch):
+        """Errors raised while detecting adapters surface as MemoryStoreError."""
+        from specmem import SpecMemClient
+        from specmem.client.exceptions import MemoryStoreError
+
+        def broken_detect(path):
+            raise OSError("unreadable")
+
+        monkeypatch.setattr("specmem.client.client.detect_adapters", broken_detect)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+
+            with pytest.raises(MemoryStoreError, match="unreadable"):
+                client.list_specs()
+
+    def test_validation_cache_follows_blocks_version(self, monkeypatch):
+        """Validation results are reused until the loaded specs change."""
+        from specmem import SpecMemClient
+
+        blocks = _spec_blocks(2)
+        monkeypatch.setattr(
+            "specmem.client.client.detect_adapters", lambda path: [_CountingAdapter(blocks)]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+            runs = []
+
+            def fake_run_validation(spec_id):
+                runs.append(spec_id)
+                return object()
+
+            monkeypatch.setattr(client, "_run_validation", fake_run_validation)
+
+            first = client.validate()
+            assert client.validate() is first
+            assert client.validate("spec-0") is not first
+            assert runs == [None, "spec-0"]
+
+            # Reloading specs bumps the version and invalidates cached results
+            client._load_specs()
+            assert client.validate() is not first
+            assert runs == [None, "spec-0", None]
+
+            # So does tracking a new spec version
+            client.track_spec_version(blocks[0])
+            client.validate("spec-0")
+            assert runs == [None, "spec-0", None, "spec-0"]
+
+
+class TestImpactedSpecs:
+    """Impacted specs come back in load order, whatever order the graph uses."""
+
+    def test_impacted_specs_follow_load_order(self, monkeypatch):
+        """Blocks are returned in load order, including blocks sharing an ID."""
+        from types import SimpleNamespace
+
+        from specmem import SpecMemClient
+
+        blocks = _spec_blocks(4)
+        # A second adapter can produce a block with an ID already seen
+        blocks.append(blocks[1].model_copy(update={"source": "other/requirements.md"}))
+        monkeypatch.setattr(
+            "specmem.client.client.detect_adapters", lambda path: [_CountingAdapter(blocks)]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SpecMemClient(path=tmpdir)
+            impact_set = SimpleNamespace(
+                specs=[SimpleNamespace(id=f"spec:spec-{i}") for i in (3, 1, 0)]
+            )
+            monkeypatch.setattr(client, "get_impact_set", lambda files: impact_set)
+
+            impacted = client.get_impacted_specs(["src/app.py"])
+
+            assert impacted == [blocks[0], blocks[1], blocks[3], blocks[4]]
+
+
 class TestLegacyExclusion:
     """**Feature: specmem-client-api, Property 7: Legacy Exclusion**
 
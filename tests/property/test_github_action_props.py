@@ -216,11 +216,7 @@ def test_threshold_evaluation_correctness(coverage: float, threshold: float) ->
     **Validates: Requirements 4.2**
     """
 
-    # Import or implement the check function
-    def check_coverage_threshold(coverage: float, threshold: float) -> str | None:
-        if threshold > 0 and coverage < threshold:
-            return f"Coverage {coverage:.1f}% is below threshold {threshold}%"
-        return None
+    from threshold_checker import check_coverage_threshold
 
     result = check_coverage_threshold(coverage, threshold)
 
@@ -256,16 +252,7 @@ def test_health_grade_comparison(current_grade: str, threshold_grade: str) -> No
 
     **Validates: Requirements 4.3**
     """
-    GRADE_ORDER = {"A": 5, "B": 4, "C": 3, "D": 2, "F": 1, "N/A": 0}
-
-    def check_health_threshold(grade: str, threshold: str) -> str | None:
-        if not threshold:
-            return None
-        current_order = GRADE_ORDER.get(grade.upper(), 0)
-        threshold_order = GRADE_ORDER.get(threshold.upper(), 0)
-        if current_order < threshold_order:
-            return f"Health grade {grade} is below threshold {threshold}"
-        return None
+    from threshold_checker import GRADE_ORDER, check_health_threshold
 
     result = check_health_threshold(current_grade, threshold_grade)
 
@@ -279,6 +266,78 @@ def test_health_grade_comparison(current_grade: str, threshold_grade: str) -> No
         assert result is None, f"Should pass: {current_grade} >= {threshold_grade}"
 
 
+@given(grade=st.one_of(st.sampled_from([*VALID_GRADES, "N/A"]), st.text(max_size=3)))
+@settings(max_examples=200)
+def test_grade_order_matches_dict_lookup(grade: str) -> None:
+    """grade_order SHALL agree with a case-insensitive GRADE_ORDER lookup for any string."""
+    from threshold_checker import GRADE_ORDER, grade_order
+
+    assert grade_order(grade) == GRADE_ORDER.get(grade.upper(), 0)
+    assert grade_order(grade.lower()) == grade_order(grade.upper())
+
+
+@given(
+    coverage=coverage_strategy,
+    cov_threshold=coverage_strategy,
+    grade=grade_strategy,
+    health_threshold=st.sampled_from(["", *VALID_GRADES]),
+    error_count=error_count_strategy,
+    fail_on_validation=st.booleans(),
+)
+@settings(max_examples=100)
+def test_main_fails_iff_any_check_fails(
+    *,
+    coverage: float,
+    cov_threshold: float,
+    grade: str,
+    health_threshold: str,
+    error_count: int,
+    fail_on_validation: bool,
+) -> None:
+    """main SHALL exit 1 with one error line per failed check, and 0 otherwise."""
+    import contextlib
+    import io
+    import json
+    import os
+    from unittest import mock
+
+    import threshold_checker
+
+    env = {
+        "RESULTS_JSON": json.dumps(
+            {
+                "coverage_percentage": coverage,
+                "health_grade": grade,
+                "validation_errors": error_count,
+            }
+        ),
+        "COVERAGE_THRESHOLD": str(cov_threshold),
+        "HEALTH_THRESHOLD": health_threshold,
+        "FAIL_ON_VALIDATION": str(fail_on_validation).lower(),
+    }
+    expected = [
+        failure
+        for failure in (
+            threshold_checker.check_coverage_threshold(coverage, cov_threshold),
+            threshold_checker.check_health_threshold(grade, health_threshold),
+            threshold_checker.check_validation_errors(error_count, fail_on_validation),
+        )
+        if failure is not None
+    ]
+
+    out = io.StringIO()
+    with mock.patch.dict(os.environ, env), contextlib.redirect_stdout(out):
+        code = threshold_checker.main()
+
+    errors = [
+        line[len("::error::") :]
+        for line in out.getvalue().splitlines()
+        if line.startswith("::error::")
+    ]
+    assert errors == expected
+    assert code == (1 if expected else 0)
+
+
 # =============================================================================
 # Property 6: Output completeness
 # For any successful run, all outputs are set
@@ -321,6 +380,188 @@ def test_output_completeness(results: dict) -> None:
     assert results["validation_errors"] >= 0
 
 
+# =============================================================================
+# Property 7: Results JSON round-trip
+# For any summary and command results, the spliced JSON parses to the dict
+# it stands in for
+# =============================================================================
+
+json_value_strategy = st.recursive(
+    st.none()
+    | st.booleans()
+    | st.integers(min_value=-(2**53), max_value=2**53)
+    | st.floats(allow_nan=False, allow_infinity=False)
+    | st.text(),
+    lambda children: (
+        st.lists(children, max_size=3) | st.dictionaries(st.text(max_size=8), children, max_size=3)
+    ),
+    max_leaves=10,
+)
+
+command_data_strategy = st.dictionaries(st.text(max_size=8), json_value_strategy, max_size=4)
+
+
+@given(
+    summary=st.dictionaries(st.text(max_size=8), json_value_strategy, min_size=1, max_size=4),
+    command_data=st.dictionaries(
+        st.text(max_size=8),
+        st.tuples(command_data_strategy, st.sampled_from([None, "compact", "indented"])),
+        max_size=3,
+    ),
+)
+@settings(max_examples=200)
+def test_results_json_round_trip(
+    summary: dict, command_data: dict[str, tuple[dict, str | None]]
+) -> None:
+    """**Feature: github-action, Property 7: Results JSON round-trip**
+
+    For any non-empty summary and any command results, whether their output
+    is spliced in verbatim or re-encoded, build_results_json SHALL produce
+    JSON equal to ``{**summary, "commands": {...}}``.
+    """
+    import json
+
+    import runner
+
+    results = {}
+    for name, (data, raw_form) in command_data.items():
+        if raw_form is None:
+            raw_json = None
+        elif raw_form == "compact":
+            raw_json = json.dumps(data).encode()
+        else:
+            raw_json = json.dumps(data, indent=2, ensure_ascii=False).encode()
+        results[name] = runner.CommandResult(name, True, b"", data, raw_json)
+
+    output = runner.build_results_json(summary, results)
+
+    expected = {**summary, "commands": {name: data for name, (data, _) in command_data.items()}}
+    assert json.loads(output) == expected
+
+
+def test_results_json_without_commands() -> None:
+    """An empty result set still yields a valid object with an empty "commands"."""
+    import json
+
+    import runner
+
+    summary = {"coverage_percentage": 0, "health_grade": "N/A"}
+
+    output = runner.build_results_json(summary, {})
+
+    assert json.loads(output) == {**summary, "commands": {}}
+
+
+# =============================================================================
+# Property 8: Output file format
+# Queued outputs are appended to GITHUB_OUTPUT in the documented formats
+# =============================================================================
+
+
+def test_flush_outputs_writes_single_and_multiline_values(tmp_path, monkeypatch) -> None:
+    """Single-line values use name=value; values with newlines use the heredoc form."""
+    import runner
+
+    output_file = tmp_path / "github_output"
+    output_file.write_bytes(b"existing=1\n")
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+    monkeypatch.setattr(runner, "_pending_outputs", [])
+
+    runner.set_output("health_grade", "A")
+    runner.set_output("results_json", b'{\n  "a": 1\n}')
+    runner.set_output("note", "café\nok")
+    runner.flush_outputs()
+
+    assert output_file.read_bytes() == (
+        b"existing=1\n"
+        b"health_grade=A\n"
+        b'results_json<<EOF\n{\n  "a": 1\n}\nEOF\n'
+        b"note<<EOF\ncaf\xc3\xa9\nok\nEOF\n"
+    )
+
+
+def test_flush_outputs_empties_buffer(tmp_path, monkeypatch) -> None:
+    """A flush clears the queue, so a second flush writes nothing new."""
+    import runner
+
+    output_file = tmp_path / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+    monkeypatch.setattr(runner, "_pending_outputs", [])
+
+    runner.set_output("coverage_percentage", "42.0")
+    runner.flush_outputs()
+
+    assert runner._pending_outputs == []
+    runner.flush_outputs()
+    assert output_file.read_bytes() == b"coverage_percentage=42.0\n"
+
+
+def test_flush_outputs_without_github_output(monkeypatch, capsys) -> None:
+    """Without GITHUB_OUTPUT, outputs are printed and the buffer is still emptied."""
+    import runner
+
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.setattr(runner, "_pending_outputs", [])
+
+    runner.set_output("health_grade", "B")
+    runner.flush_outputs()
+
+    assert capsys.readouterr().out == "::set-output name=health_grade::B\n"
+    assert runner._pending_outputs == []
+
+
+# =============================================================================
+# Property 9: Command logging
+# Every command is announced before it runs, inside one outer log group
+# =============================================================================
+
+
+def test_run_and_report_announces_command_before_running(monkeypatch, capsys) -> None:
+    """The start line is already written when the command begins running."""
+    import runner
+
+    seen_before_run = []
+
+    def fake_run_command(cmd, working_dir):
+        seen_before_run.append(capsys.readouterr().out)
+        return runner.CommandResult(cmd, False, "boom ✗".encode(), {})
+
+    monkeypatch.setattr(runner, "run_command", fake_run_command)
+
+    runner.run_and_report("health", ".")
+
+    assert seen_before_run == ["--- Running: specmem health ---\n"]
+    assert capsys.readouterr().out == (
+        "⚠️ health had issues (continuing with other commands)\nOutput: boom ✗\n"
+    )
+
+
+def test_main_logs_commands_in_one_group(tmp_path, monkeypatch, capsys) -> None:
+    """All per-command lines sit inside a single ::group:: ... ::endgroup:: block."""
+    import runner
+
+    monkeypatch.setattr(
+        runner,
+        "run_command",
+        lambda cmd, working_dir: runner.CommandResult(cmd, True, b"", {}),
+    )
+    monkeypatch.setattr(runner, "_pending_outputs", [])
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.setenv("COMMANDS", "cov,health,validate")
+    monkeypatch.setenv("WORKING_DIR", str(tmp_path))
+
+    assert runner.main() == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "::group::Running SpecMem commands: cov, health, validate"
+    assert [line for line in lines if line.startswith("::group::")] == [lines[0]]
+    end = lines.index("::endgroup::")
+    for cmd in ("cov", "health", "validate"):
+        start = lines.index(f"--- Running: specmem {cmd} ---")
+        done = lines.index(f"✅ {cmd} completed successfully")
+        assert 0 < start < done < end
+
+
 # =============================================================================
 # Additional edge case tests
 # =============================================================================
@@ -342,7 +583,7 @@ def test_whitespace_command_handling() -> None:
 
 def test_grade_ordering_is_complete() -> None:
     """Test that all grades have defined ordering."""
-    GRADE_ORDER = {"A": 5, "B": 4, "C": 3, "D": 2, "F": 1, "N/A": 0}
+    from threshold_checker import GRADE_ORDER
 
     # Verify ordering is consistent
     assert GRADE_ORDER["A"] > GRADE_ORDER["B"]
@@ -350,3 +591,85 @@ def test_grade_ordering_is_complete() -> None:
     assert GRADE_ORDER["C"] > GRADE_ORDER["D"]
     assert GRADE_ORDER["D"] > GRADE_ORDER["F"]
     assert GRADE_ORDER["F"] > GRADE_ORDER["N/A"]
+
+
+# =============================================================================
+# JSON codec fallback and the no-threshold fast path in threshold_checker
+# =============================================================================
+
+
+def _fake_codec(name: str, calls: list[str]):
+    """Build a stand-in codec module that records which codec parsed the input."""
+    import json
+    import types
+
+    def loads(data):
+        calls.append(name)
+        return json.loads(data)
+
+    return types.SimpleNamespace(__name__=name, loads=loads)
+
+
+def test_json_loads_prefers_orjson(monkeypatch) -> None:
+    """orjson is used when it can be imported."""
+    import threshold_checker
+
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "orjson", _fake_codec("orjson", calls))
+    monkeypatch.setitem(sys.modules, "ujson", _fake_codec("ujson", calls))
+
+    assert threshold_checker.json_loads('{"a": 1}') == {"a": 1}
+    assert calls == ["orjson"]
+
+
+def test_json_loads_falls_back_to_ujson(monkeypatch) -> None:
+    """Without orjson, ujson is used."""
+    import threshold_checker
+
+    calls: list[str] = []
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", _fake_codec("ujson", calls))
+
+    assert threshold_checker.json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert calls == ["ujson"]
+
+
+def test_json_loads_falls_back_to_stdlib(monkeypatch) -> None:
+    """Without orjson or ujson, stdlib json parses the input and raises ValueError on junk."""
+    import pytest
+    import threshold_checker
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+
+    assert threshold_checker.json_loads('{"health_grade": "B"}') == {"health_grade": "B"}
+    with pytest.raises(ValueError):
+        threshold_checker.json_loads("not json")
+
+
+def test_main_skips_parsing_without_thresholds(monkeypatch, capsys) -> None:
+    """With no thresholds set, main passes without parsing RESULTS_JSON at all."""
+    import threshold_checker
+
+    def fail_loads(data):
+        raise AssertionError("results were parsed")
+
+    monkeypatch.setattr(threshold_checker, "json_loads", fail_loads)
+    monkeypatch.setenv("RESULTS_JSON", '{"coverage_percentage": 0, "validation_errors": 3}')
+    monkeypatch.setenv("COVERAGE_THRESHOLD", "0")
+    monkeypatch.delenv("HEALTH_THRESHOLD", raising=False)
+    monkeypatch.setenv("FAIL_ON_VALIDATION", "false")
+
+    assert threshold_checker.main() == 0
+    assert capsys.readouterr().out == "✅ All threshold checks passed\n"
+
+
+def test_main_warns_on_unparseable_results(monkeypatch, capsys) -> None:
+    """With a threshold set, malformed results JSON is reported and does not fail the run."""
+    import threshold_checker
+
+    monkeypatch.setenv("RESULTS_JSON", "{not json")
+    monkeypatch.setenv("COVERAGE_THRESHOLD", "50")
+
+    assert threshold_checker.main() == 0
+    assert "::warning::Failed to parse results JSON" in capsys.readouterr().out
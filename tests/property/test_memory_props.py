@@ -27,12 +27,12 @@ source_strategy = st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
 EMBEDDING_DIM = 8
 
 
-def generate_random_embedding(seed: int) -> list[float]:
+def generate_random_embedding(seed: int, dim: int = EMBEDDING_DIM) -> list[float]:
     """Generate a deterministic random embedding from seed."""
     import random
 
     rng = random.Random(seed)
-    return [rng.random() for _ in range(EMBEDDING_DIM)]
+    return [rng.random() for _ in range(dim)]
 
 
 @st.composite
@@ -265,3 +265,165 @@ def test_clear_store() -> None:
 
         store.clear()
         assert store.count() == 0
+
+
+class _SeededEmbeddingProvider:
+    """Embeds each text deterministically and counts provider calls."""
+
+    def __init__(self, dimension: int = EMBEDDING_DIM, model_name: str = "seeded") -> None:
+        self.calls = 0
+        self.texts: list[str] = []
+        self.dimension = dimension
+        self.model_name = model_name
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.texts.extend(texts)
+        return [generate_random_embedding(sum(map(ord, text)), self.dimension) for text in texts]
+
+
+@given(
+    blocks=st.lists(valid_specblock_strategy(), min_size=1, max_size=10, unique_by=lambda b: b.id),
+    queries=st.lists(st.sampled_from(["auth", "login", "cache", "auth"]), min_size=1, max_size=6),
+)
+@settings(max_examples=25, deadline=None)
+def test_batch_query_matches_single_queries(blocks: list[SpecBlock], queries: list[str]) -> None:
+    """For any set of queries, batch_query returns what query returns for each,
+    using a single embedding call."""
+    from specmem.core.memory_bank import MemoryBank
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = LanceDBStore(db_path=str(Path(tmpdir) / "vectordb"))
+        provider = _SeededEmbeddingProvider()
+        bank = MemoryBank(store, provider)
+        bank.initialize()
+        bank.add_blocks(blocks)
+
+        provider.calls = 0
+        batched = bank.batch_query(queries, top_k=5)
+        assert provider.calls == 1
+
+        for query, results in zip(queries, batched, strict=True):
+            single = bank.query(query, top_k=5)
+            assert [r.block.id for r in results] == [r.block.id for r in single]
+
+
+@given(
+    blocks=st.lists(valid_specblock_strategy(), min_size=2, max_size=10, unique_by=lambda b: b.id)
+)
+@settings(max_examples=25, deadline=None)
+def test_dot_metric_ranks_by_cosine_similarity(blocks: list[SpecBlock]) -> None:
+    """For any stored vectors, the dot metric ranks results by cosine similarity."""
+    import itertools
+    import math
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = LanceDBStore(db_path=str(Path(tmpdir) / "vectordb"), metric="dot")
+        store.initialize()
+
+        # Vary magnitudes so raw inner products would rank differently
+        embeddings = [
+            [x * (i + 1) for x in generate_random_embedding(i)] for i in range(len(blocks))
+        ]
+        store.store(blocks, embeddings)
+
+        query_embedding = generate_random_embedding(999)
+        results = store.query(query_embedding, top_k=len(blocks))
+
+        def cosine(vector: list[float]) -> float:
+            dot = sum(a * b for a, b in zip(vector, query_embedding, strict=True))
+            return dot / math.sqrt(sum(a * a for a in vector))
+
+        similarities = {b.id: cosine(e) for b, e in zip(blocks, embeddings, strict=True)}
+        ranked = [similarities[r.block.id] for r in results]
+        assert all(a >= b - 1e-5 for a, b in itertools.pairwise(ranked))
+
+
+@given(
+    blocks=st.lists(valid_specblock_strategy(), min_size=1, max_size=10, unique_by=lambda b: b.id)
+)
+@settings(max_examples=25, deadline=None)
+def test_unchanged_blocks_are_not_reembedded(blocks: list[SpecBlock]) -> None:
+    """For any blocks already stored, adding them again reuses their embeddings."""
+    from specmem.core.memory_bank import MemoryBank
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "vectordb")
+        provider = _SeededEmbeddingProvider()
+        bank = MemoryBank(LanceDBStore(db_path=db_path), provider)
+        bank.initialize()
+        bank.add_blocks(blocks)
+
+        # A fresh bank over the same database, as on the next session
+        provider.calls = 0
+        reloaded = MemoryBank(LanceDBStore(db_path=db_path), provider)
+        reloaded.initialize()
+        reloaded.add_blocks(blocks)
+
+        assert provider.calls == 0
+        assert reloaded.vector_store.count() == len(blocks)
+
+
+@pytest.mark.parametrize(
+    ("dimension", "model_name"),
+    [(16, "seeded"), (EMBEDDING_DIM, "other-model")],
+)
+def test_changed_embedding_model_reembeds_all_blocks(dimension: int, model_name: str) -> None:
+    """Stored vectors from another model or dimension are never reused."""
+    from specmem.core.memory_bank import MemoryBank
+
+    blocks = [
+        SpecBlock(
+            id=f"block-{i}",
+            type=SpecType.REQUIREMENT,
+            text=f"The system SHALL handle case {i}",
+            source="specs/requirements.md",
+        )
+        for i in range(5)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "vectordb")
+        bank = MemoryBank(LanceDBStore(db_path=db_path), _SeededEmbeddingProvider())
+        bank.initialize()
+        bank.add_blocks(blocks)
+
+        provider = _SeededEmbeddingProvider(dimension=dimension, model_name=model_name)
+        reloaded = MemoryBank(LanceDBStore(db_path=db_path), provider)
+        reloaded.initialize()
+        reloaded.add_blocks(blocks)
+
+        assert provider.calls == 1
+        assert sorted(provider.texts) == sorted(b.text for b in blocks)
+        results = reloaded.query("case 3", top_k=5)
+        assert {r.block.id for r in results} == {b.id for b in blocks}
+
+
+def test_duplicate_block_ids_keep_their_own_embeddings() -> None:
+    """Blocks sharing an ID but not text are embedded and reused separately."""
+    from specmem.core.memory_bank import MemoryBank
+
+    blocks = [
+        SpecBlock(id="dup", type=SpecType.REQUIREMENT, text=text, source="a.md")
+        for text in ("The system SHALL log in", "The system SHALL log out")
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "vectordb")
+        provider = _SeededEmbeddingProvider()
+        bank = MemoryBank(LanceDBStore(db_path=db_path), provider)
+        bank.initialize()
+        bank.add_blocks(blocks)
+        assert sorted(provider.texts) == sorted(b.text for b in blocks)
+
+        provider.calls = 0
+        reloaded = MemoryBank(LanceDBStore(db_path=db_path), provider)
+        reloaded.initialize()
+        reloaded.add_blocks(blocks)
+        assert provider.calls == 0
+
+        rows = reloaded.vector_store.table.to_arrow().to_pylist()
+        vectors = {row["text"]: row["vector"] for row in rows}
+        for block in blocks:
+            expected = generate_random_embedding(sum(map(ord, block.text)))
+            assert vectors[block.text] == pytest.approx(expected)
@@ -5,12 +5,15 @@ These tests verify correctness properties for the UI backend logic.
 
 import string
 
+import numpy as np
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from specmem.core.specir import SpecBlock, SpecStatus, SpecType
 from specmem.ui.filters import (
+    BlockColumns,
     calculate_counts,
+    compute_stats,
     count_by_source,
     count_by_type,
     filter_blocks,
@@ -23,16 +26,23 @@ from specmem.ui.models import (
 )
 
 
+# Shared settings: derandomized draws are reproducible across CI runs, and the
+# model-building tests can exceed the default per-example deadline
+ui_settings = settings(derandomize=True, deadline=None, print_blob=False)
+
 # Strategies for generating test data
 spec_type_strategy = st.sampled_from(list(SpecType))
 spec_status_strategy = st.sampled_from(list(SpecStatus))
 
-# Generate valid non-empty text
-text_strategy = st.text(
-    alphabet=string.ascii_letters + string.digits + " .,!?-_\n",
-    min_size=1,
-    max_size=1000,
-).filter(lambda x: x.strip())
+# Generate valid non-empty text. A non-whitespace character is drawn explicitly
+# instead of filtering out whitespace-only text, so no draw is rejected.
+_text_alphabet = string.ascii_letters + string.digits + " .,!?-_\n"
+text_strategy = st.builds(
+    lambda head, mark, tail: head + mark + tail,
+    st.text(alphabet=_text_alphabet, max_size=499),
+    st.sampled_from(_text_alphabet.replace(" ", "").replace("\n", "")),
+    st.text(alphabet=_text_alphabet, max_size=500),
+)
 
 # Generate SpecBlocks
 spec_block_strategy = st.builds(
@@ -43,7 +53,7 @@ spec_block_strategy = st.builds(
         alphabet=string.ascii_lowercase + "/._",
         min_size=5,
         max_size=50,
-    ).filter(lambda x: x.strip()),
+    ),
     status=spec_status_strategy,
     tags=st.lists(st.text(min_size=1, max_size=20), max_size=5),
     links=st.lists(st.text(min_size=1, max_size=50), max_size=3),
@@ -61,7 +71,7 @@ class TestTextTruncation:
     # **Validates: Requirements 2.4**
 
     @given(st.text(min_size=0, max_size=500))
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_truncation_preserves_short_text(self, text: str):
         """Text shorter than 200 chars should not be truncated."""
         if len(text) <= 200:
@@ -69,7 +79,7 @@ class TestTextTruncation:
             assert result == text, "Short text should not be modified"
 
     @given(st.text(min_size=201, max_size=1000))
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_truncation_adds_ellipsis_to_long_text(self, text: str):
         """Text longer than 200 chars should be truncated with ellipsis."""
         result = truncate_text(text)
@@ -78,7 +88,7 @@ class TestTextTruncation:
         assert result[:200] == text[:200], "First 200 chars should be preserved"
 
     @given(st.text(min_size=1, max_size=1000))
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_truncation_length_invariant(self, text: str):
         """Truncated text should never exceed 203 characters."""
         result = truncate_text(text)
@@ -92,7 +102,7 @@ class TestBlockResponseCompleteness:
     # **Validates: Requirements 2.3**
 
     @given(spec_block_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_block_summary_contains_required_fields(self, block: SpecBlock):
         """BlockSummary should contain all required fields."""
         summary = BlockSummary.from_spec_block(block)
@@ -106,7 +116,7 @@ class TestBlockResponseCompleteness:
         assert len(summary.text_preview) <= 203
 
     @given(spec_block_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_block_detail_contains_all_fields(self, block: SpecBlock):
         """BlockDetail should contain all fields including full text."""
         detail = BlockDetail.from_spec_block(block)
@@ -128,7 +138,7 @@ class TestFilterCorrectness:
     # **Validates: Requirements 3.2, 3.3, 3.4, 3.5, 4.2, 4.3, 4.4**
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_active_filter_returns_only_active(self, blocks: list[SpecBlock]):
         """Active filter should return only active blocks."""
         filtered = filter_blocks(blocks, status="active")
@@ -136,7 +146,7 @@ class TestFilterCorrectness:
             assert block.status == SpecStatus.ACTIVE
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_legacy_filter_returns_only_legacy(self, blocks: list[SpecBlock]):
         """Legacy filter should return only legacy blocks."""
         filtered = filter_blocks(blocks, status="legacy")
@@ -144,7 +154,7 @@ class TestFilterCorrectness:
             assert block.status == SpecStatus.LEGACY
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_all_filter_returns_all_blocks(self, blocks: list[SpecBlock]):
         """All/no filter should return all blocks."""
         filtered_all = filter_blocks(blocks, status="all")
@@ -154,7 +164,7 @@ class TestFilterCorrectness:
         assert len(filtered_none) == len(blocks)
 
     @given(spec_blocks_strategy, spec_type_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_type_filter_returns_only_matching_type(
         self, blocks: list[SpecBlock], block_type: SpecType
     ):
@@ -164,7 +174,7 @@ class TestFilterCorrectness:
             assert block.type == block_type
 
     @given(spec_blocks_strategy, spec_status_strategy, spec_type_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_combined_filters_use_and_logic(
         self, blocks: list[SpecBlock], status: SpecStatus, block_type: SpecType
     ):
@@ -175,7 +185,7 @@ class TestFilterCorrectness:
             assert block.type == block_type
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_filter_count_matches_result_length(self, blocks: list[SpecBlock]):
         """Calculated counts should match filtered result lengths."""
         filtered = filter_blocks(blocks, status="active")
@@ -186,6 +196,25 @@ class TestFilterCorrectness:
         assert legacy == len([b for b in filtered if b.status == SpecStatus.LEGACY])
         assert pinned == len([b for b in filtered if b.pinned])
 
+    @given(
+        spec_blocks_strategy,
+        st.sampled_from([None, "", "all", "bogus", *(s.value for s in SpecStatus)]),
+        st.sampled_from([None, "", "ALL", "bogus", *(t.value for t in SpecType)]),
+    )
+    @settings(ui_settings, max_examples=100)
+    def test_columnar_filter_matches_list_filter(
+        self, blocks: list[SpecBlock], status: str | None, block_type: str | None
+    ):
+        """Vectorized filtering and counts should match the list-based helpers."""
+        columns = BlockColumns(blocks)
+        expected = filter_blocks(blocks, status=status, block_type=block_type)
+
+        filtered = filter_blocks(blocks, status=status, block_type=block_type, columns=columns)
+        assert [b.id for b in filtered] == [b.id for b in expected]
+
+        mask = columns.mask(status=status, block_type=block_type)
+        assert columns.counts(mask) == calculate_counts(expected)
+
 
 class TestSearchResultOrdering:
     """Tests for Property 5: Search Result Ordering."""
@@ -196,7 +225,7 @@ class TestSearchResultOrdering:
     @given(
         st.lists(st.floats(min_value=0.0, max_value=1.0, allow_nan=False), min_size=2, max_size=20)
     )
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_scores_are_non_negative(self, scores: list[float]):
         """All search result scores should be non-negative."""
         for score in scores:
@@ -205,7 +234,7 @@ class TestSearchResultOrdering:
     @given(
         st.lists(st.floats(min_value=0.0, max_value=1.0, allow_nan=False), min_size=2, max_size=20)
     )
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_sorted_scores_are_descending(self, scores: list[float]):
         """Sorted results should be in descending order by score."""
         sorted_scores = sorted(scores, reverse=True)
@@ -220,7 +249,7 @@ class TestPinnedBlockRetrieval:
     # **Validates: Requirements 6.1, 6.3**
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_pinned_returns_only_pinned_blocks(self, blocks: list[SpecBlock]):
         """Pinned endpoint should return exactly all pinned blocks."""
         pinned = get_pinned_blocks(blocks)
@@ -231,7 +260,7 @@ class TestPinnedBlockRetrieval:
             assert block.pinned is True
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_all_pinned_blocks_are_returned(self, blocks: list[SpecBlock]):
         """All pinned blocks should be in the result."""
         pinned = get_pinned_blocks(blocks)
@@ -241,6 +270,13 @@ class TestPinnedBlockRetrieval:
             if block.pinned:
                 assert block.id in pinned_ids
 
+    @given(spec_blocks_strategy)
+    @settings(ui_settings, max_examples=100)
+    def test_pinned_index_matches_scan(self, blocks: list[SpecBlock]):
+        """Pinned lookup through a precomputed index should match a full scan."""
+        pinned_index = np.flatnonzero(BlockColumns(blocks).pinned)
+        assert get_pinned_blocks(blocks, pinned_index) == get_pinned_blocks(blocks)
+
 
 class TestStatisticsAccuracy:
     """Tests for Property 7: Statistics Accuracy."""
@@ -249,14 +285,14 @@ class TestStatisticsAccuracy:
     # **Validates: Requirements 2.1, 8.1, 8.2**
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_total_count_matches_block_count(self, blocks: list[SpecBlock]):
         """Total count should equal number of blocks."""
         total, active, legacy, pinned = calculate_counts(blocks)
         assert total == len(blocks)
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_status_counts_are_accurate(self, blocks: list[SpecBlock]):
         """Active and legacy counts should match actual counts."""
         total, active, legacy, pinned = calculate_counts(blocks)
@@ -268,27 +304,42 @@ class TestStatisticsAccuracy:
         assert legacy == actual_legacy
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_type_counts_sum_to_total(self, blocks: list[SpecBlock]):
         """Type counts should sum to total."""
         by_type = count_by_type(blocks)
         assert sum(by_type.values()) == len(blocks)
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_source_counts_sum_to_total(self, blocks: list[SpecBlock]):
         """Source counts should sum to total."""
         by_source = count_by_source(blocks)
         assert sum(by_source.values()) == len(blocks)
 
     @given(spec_blocks_strategy)
-    @settings(max_examples=100)
+    @settings(ui_settings, max_examples=100)
     def test_pinned_count_is_accurate(self, blocks: list[SpecBlock]):
         """Pinned count should match actual pinned blocks."""
         total, active, legacy, pinned = calculate_counts(blocks)
         actual_pinned = sum(1 for b in blocks if b.pinned)
         assert pinned == actual_pinned
 
+    @given(spec_blocks_strategy)
+    @settings(ui_settings, max_examples=100)
+    def test_compute_stats_matches_individual_helpers(self, blocks: list[SpecBlock]):
+        """Single-pass stats should agree with the per-aggregate helpers."""
+        stats = compute_stats(blocks)
+        total, active, legacy, pinned = calculate_counts(blocks)
+
+        assert stats["total_blocks"] == total
+        assert stats["active_count"] == active
+        assert stats["legacy_count"] == legacy
+        assert stats["pinned_count"] == pinned
+        assert stats["by_type"] == count_by_type(blocks)
+        assert stats["by_source"] == count_by_source(blocks)
+        assert stats["memory_size_bytes"] == sum(len(b.text.encode("utf-8")) for b in blocks)
+
 
 class TestPortConfiguration:
     """Tests for Property 1: Server Port Configuration."""
@@ -297,13 +348,13 @@ class TestPortConfiguration:
     # **Validates: Requirements 1.1, 1.3**
 
     @given(st.integers(min_value=1024, max_value=65535))
-    @settings(max_examples=20)
+    @settings(ui_settings, max_examples=20)
     def test_valid_port_range(self, port: int):
         """Valid ports should be in range 1024-65535."""
         assert 1024 <= port <= 65535, "Port must be in valid range"
 
     @given(st.integers(min_value=1024, max_value=65535))
-    @settings(max_examples=20)
+    @settings(ui_settings, max_examples=20)
     def test_port_availability_check_returns_bool(self, port: int):
         """Port availability check should return boolean."""
         from specmem.ui.server import is_port_available
@@ -312,7 +363,7 @@ class TestPortConfiguration:
         assert isinstance(result, bool)
 
     @given(st.integers(min_value=1024, max_value=60000))
-    @settings(max_examples=10)
+    @settings(ui_settings, max_examples=10)
     def test_find_available_port_returns_valid_port(self, preferred: int):
         """find_available_port should return a port >= preferred."""
         from specmem.ui.server import find_available_port
@@ -333,7 +384,7 @@ class TestTourStepAdvancement:
     # **Validates: Requirements 10.3**
 
     @given(st.integers(min_value=1, max_value=20))
-    @settings(max_examples=50)
+    @settings(ui_settings, max_examples=50)
     def test_tour_step_advancement_logic(self, total_steps: int):
         """For any tour with N steps, completing step K advances to K+1."""
         # Simulate tour state
@@ -356,7 +407,7 @@ class TestTourStepAdvancement:
         assert current_step == total_steps - 1 or current_step >= total_steps - 1
 
     @given(st.integers(min_value=1, max_value=10), st.integers(min_value=0, max_value=9))
-    @settings(max_examples=50)
+    @settings(ui_settings, max_examples=50)
     def test_completing_step_k_advances_to_k_plus_1(self, total_steps: int, start_step: int):
         """Completing step K should advance to step K+1."""
         if start_step >= total_steps:
@@ -371,7 +422,7 @@ class TestTourStepAdvancement:
             assert next_step >= total_steps, "Should end tour when completing last step"
 
     @given(st.integers(min_value=1, max_value=20))
-    @settings(max_examples=50)
+    @settings(ui_settings, max_examples=50)
     def test_completing_last_step_ends_tour(self, total_steps: int):
         """Completing step N (last step) should end the tour."""
         last_step = total_steps - 1
@@ -383,7 +434,7 @@ class TestTourStepAdvancement:
         assert next_step >= total_steps, "Tour should be marked as complete"
 
     @given(st.lists(st.text(min_size=1, max_size=50), min_size=1, max_size=10))
-    @settings(max_examples=30)
+    @settings(ui_settings, max_examples=30)
     def test_tour_steps_are_sequential(self, step_titles: list[str]):
         """Tour steps should be visited in sequential order."""
         visited_steps = []
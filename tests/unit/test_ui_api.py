@@ -0,0 +1,274 @@
+"""Endpoint tests for the SpecMem Web UI REST API.
+
+Requests are sent straight to the ASGI app, so no HTTP client package is
+needed. Skipped when FastAPI is not installed.
+"""
+
+from __future__ import annotations
+
+import json
+import urllib.parse
+
+import pytest
+
+from specmem.core.specir import SpecBlock, SpecStatus, SpecType
+
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+
+from specmem.ui import api
+from specmem.ui.filters import (
+    calculate_counts,
+    count_by_source,
+    count_by_type,
+    filter_blocks,
+)
+from specmem.ui.models import (
+    BlockListResponse,
+    BlockSummary,
+    PinnedBlockResponse,
+    PinnedListResponse,
+    StatsResponse,
+)
+
+
+def _block(i: int, *, pinned: bool = False) -> SpecBlock:
+    text = f"Spec {i}: the system SHALL handle case {i}. " * (i % 4 + 1)
+    return SpecBlock(
+        id=SpecBlock.generate_id(f"specs/{i % 3}.md", text),
+        type=list(SpecType)[i % len(SpecType)],
+        text=text,
+        source=f"specs/{i % 3}.md",
+        status=list(SpecStatus)[(i // 2) % len(SpecStatus)],
+        pinned=pinned,
+    )
+
+
+async def _get(
+    app: FastAPI,
+    path: str,
+    query: str = "",
+    headers: dict[str, str] | None = None,
+) -> tuple[int, dict[str, str], bytes]:
+    """Send a GET request to the ASGI app and collect the response."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"test")]
+        + [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "server": ("test", 80),
+        "client": ("test", 1234),
+    }
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, body
+
+
+@pytest.fixture
+def blocks() -> list[SpecBlock]:
+    return [_block(i, pinned=i % 3 == 0) for i in range(24)]
+
+
+@pytest.fixture
+def app(blocks):
+    api.set_context(blocks)
+    application = FastAPI()
+    application.include_router(api.router)
+    yield application
+    api.set_context([])
+
+
+ETAG_PATHS = ["/api/blocks", "/api/stats", "/api/pinned"]
+
+
+@pytest.mark.parametrize("path", ETAG_PATHS)
+async def test_etag_header_present(app, path):
+    status, headers, body = await _get(app, path)
+
+    assert status == 200
+    assert headers["etag"] == api.get_context().etag
+    assert body
+
+
+@pytest.mark.parametrize("path", ETAG_PATHS)
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        "{etag}",
+        "W/{etag}",
+        '"stale", {etag}',
+        '"stale",W/{etag}',
+        "*",
+    ],
+)
+async def test_matching_if_none_match_returns_304(app, path, if_none_match):
+    etag = api.get_context().etag
+
+    status, headers, body = await _get(
+        app, path, headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    assert status == 304
+    assert headers["etag"] == etag
+    assert body == b""
+
+
+@pytest.mark.parametrize("path", ETAG_PATHS)
+async def test_mismatched_if_none_match_returns_200(app, path):
+    status, headers, body = await _get(app, path, headers={"If-None-Match": '"stale"'})
+
+    assert status == 200
+    assert headers["etag"] == api.get_context().etag
+    assert body
+
+
+@pytest.mark.parametrize("path", ETAG_PATHS)
+async def test_etag_changes_when_blocks_change(app, blocks, path):
+    _, headers, _ = await _get(app, path)
+    old_etag = headers["etag"]
+
+    api.set_context([*blocks, _block(99, pinned=True)])
+    status, headers, _ = await _get(app, path, headers={"If-None-Match": old_etag})
+
+    assert status == 200
+    assert headers["etag"] != old_etag
+
+
+async def test_etag_changes_when_text_changes_past_preview(app, blocks):
+    """Text beyond the 200-char preview still changes /stats, so it must change the ETag."""
+    old_etag = api.get_context().etag
+    long_block = blocks[0].model_copy(update={"text": "x" * 300})
+    api.set_context([long_block, *blocks[1:]])
+    mid_etag = api.get_context().etag
+
+    api.set_context([long_block.model_copy(update={"text": "x" * 400}), *blocks[1:]])
+
+    assert len({old_etag, mid_etag, api.get_context().etag}) == 3
+
+
+STATUS_FILTERS = [None, "", "all", "ALL", "Active", "unknown", *(s.value for s in SpecStatus)]
+TYPE_FILTERS = [None, "", "all", "Design", "unknown", *(t.value for t in SpecType)]
+
+
+@pytest.mark.parametrize("status", STATUS_FILTERS)
+@pytest.mark.parametrize("block_type", TYPE_FILTERS)
+async def test_blocks_body_matches_response_model(app, blocks, status, block_type):
+    """The spliced /blocks body must equal the BlockListResponse it replaces."""
+    params = {k: v for k, v in (("status", status), ("type", block_type)) if v is not None}
+    query = urllib.parse.urlencode(params)
+
+    # Twice: serving a body must not change what the next request gets
+    for _ in range(2):
+        status_code, headers, body = await _get(app, "/api/blocks", query)
+
+        filtered = filter_blocks(blocks, status=status, block_type=block_type)
+        total, active_count, legacy_count, pinned_count = calculate_counts(filtered)
+        expected = BlockListResponse(
+            blocks=[BlockSummary.from_spec_block(b) for b in filtered],
+            total=total,
+            active_count=active_count,
+            legacy_count=legacy_count,
+            pinned_count=pinned_count,
+        )
+        assert status_code == 200
+        assert headers["content-type"] == "application/json"
+        assert json.loads(body) == expected.model_dump()
+
+
+async def test_blocks_body_matches_response_model_when_empty(app):
+    api.set_context([])
+
+    _, _, body = await _get(app, "/api/blocks")
+
+    expected = BlockListResponse(blocks=[], total=0, active_count=0, legacy_count=0, pinned_count=0)
+    assert json.loads(body) == expected.model_dump()
+
+
+def _expected_pin_reason(block: SpecBlock) -> str:
+    """Reason logic of the original per-request /pinned implementation."""
+    if "requirement" in block.type.value.lower():
+        return "Core requirement specification"
+    if "design" in block.type.value.lower():
+        return "Architecture decision"
+    return "Contains critical specification keyword (SHALL)"
+
+
+@pytest.mark.parametrize("pinned_every", [1, 3, 0])
+async def test_pinned_body_matches_response_model(app, blocks, pinned_every):
+    """The pre-serialized /pinned body must equal the PinnedListResponse it replaces."""
+    blocks = [
+        b.model_copy(update={"pinned": bool(pinned_every) and i % pinned_every == 0})
+        for i, b in enumerate(blocks)
+    ]
+    api.set_context(blocks)
+
+    status_code, headers, body = await _get(app, "/api/pinned")
+
+    pinned = [b for b in blocks if b.pinned]
+    expected = PinnedListResponse(
+        blocks=[
+            PinnedBlockResponse(
+                block=BlockSummary.from_spec_block(b), reason=_expected_pin_reason(b)
+            )
+            for b in pinned
+        ],
+        total=len(pinned),
+    )
+    assert status_code == 200
+    assert headers["content-type"] == "application/json"
+    assert json.loads(body) == expected.model_dump()
+
+
+async def test_blocks_bodies_are_built_with_the_context(app):
+    """Every valid filter has a body from set_context, and requests never add more."""
+    ctx = api.get_context()
+    bodies = dict(ctx.list_bodies)
+
+    assert len(bodies) == (len(SpecStatus) + 1) * (len(SpecType) + 1)
+    for status in STATUS_FILTERS:
+        for block_type in TYPE_FILTERS:
+            params = {k: v for k, v in (("status", status), ("type", block_type)) if v}
+            await _get(app, "/api/blocks", urllib.parse.urlencode(params))
+
+    assert ctx.list_bodies == bodies
+
+
+@pytest.mark.parametrize("count", [0, 1, 24])
+async def test_stats_body_matches_response_model(app, blocks, count):
+    """The pre-serialized /stats body must equal the StatsResponse it replaces."""
+    blocks = blocks[:count]
+    api.set_context(blocks)
+
+    status_code, headers, body = await _get(app, "/api/stats")
+
+    total, active_count, legacy_count, pinned_count = calculate_counts(blocks)
+    expected = StatsResponse(
+        total_blocks=total,
+        active_count=active_count,
+        legacy_count=legacy_count,
+        pinned_count=pinned_count,
+        by_type=count_by_type(blocks),
+        by_source=count_by_source(blocks),
+        memory_size_bytes=sum(len(b.text.encode("utf-8")) for b in blocks),
+    )
+    assert status_code == 200
+    assert headers["content-type"] == "application/json"
+    assert json.loads(body) == expected.model_dump()
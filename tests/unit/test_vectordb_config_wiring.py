@@ -27,13 +27,43 @@ def test_qdrant_collection_is_threaded_into_kwargs() -> None:
     }
 
 
-def test_non_qdrant_backend_passes_no_kwargs() -> None:
+def test_non_qdrant_backend_passes_no_qdrant_kwargs() -> None:
     config = SpecMemConfig()
-    config.vectordb = VectorDBConfig(backend="lancedb", qdrant_collection="ignored")
+    config.vectordb = VectorDBConfig(backend="chroma", qdrant_collection="ignored")
 
     assert _vector_store_kwargs(config) == {}
 
 
+@pytest.mark.parametrize("metric", ["l2", "dot"])
+def test_lancedb_metric_is_threaded_into_kwargs(metric: str) -> None:
+    config = SpecMemConfig()
+    config.vectordb = VectorDBConfig(backend="lancedb", metric=metric, qdrant_collection="ignored")
+
+    assert _vector_store_kwargs(config) == {"metric": metric}
+
+
+def test_every_entry_point_opens_lancedb_with_the_configured_metric(tmp_path) -> None:
+    from specmem.core.memory_bank import MemoryBank
+    from specmem.vectordb import get_vector_store
+
+    config = SpecMemConfig()
+    config.vectordb = VectorDBConfig(path=str(tmp_path / "vectordb"))
+
+    cli_store = get_vector_store(
+        backend=config.vectordb.backend,
+        path=config.vectordb.path,
+        **_vector_store_kwargs(config),
+    )
+    bank = MemoryBank.from_config(config)
+
+    assert cli_store.metric == bank.vector_store.metric == config.vectordb.metric == "dot"
+
+
+def test_unknown_metric_rejected() -> None:
+    with pytest.raises(ValidationError):
+        VectorDBConfig(metric="cosine")
+
+
 def test_unsupported_backend_rejected() -> None:
     with pytest.raises(ValidationError):
         VectorDBConfig(backend="sqlite-vec")